@@ -2,15 +2,21 @@
 A4 print preview: Photoshop-style dialog — left = image preview, right = printing options.
 Options: printer, margins, rows, printer settings; opens maximized.
 """
+import functools
 import os
+import re
 import subprocess
 import sys
 import tempfile
+import threading
+import time
+import types
 from pathlib import Path
 
 import tkinter as tk
 import customtkinter as ctk
-from PIL import Image, ImageTk
+import numpy as np
+from PIL import Image, ImageDraw, ImageTk
 
 # A4 in mm
 A4_W_MM = 210.0
@@ -19,54 +25,151 @@ DEFAULT_MARGIN_MM = 2.0
 GAP_MM = 1.5
 COLS = 6
 ASPECT_W, ASPECT_H = 3, 4
+_H_PER_W = ASPECT_H / ASPECT_W
 PREVIEW_DPI = 150
+MIN_PREVIEW_DPI = 20  # keeps cells a few px wide even in a tiny preview panel
 PRINT_DPI = 300
 OPTIONS_PANEL_WIDTH = 300
+THUMB_CACHE_SIZE = 4  # resized cells kept per window (preview sizes + print)
+RESIZE_TOLERANCE_PX = 4  # <Configure> changes this small don't trigger a preview redraw
+PRINTERS_CACHE_TTL_S = 30.0  # reopening the dialog within this window skips lpstat / EnumPrinters
+
+# `lpstat -p` lines look like "printer NAME is idle.  enabled since ..."
+_LPSTAT_PRINTER_RE = re.compile(r"^[ \t]*printer[ \t]+(\S+)", re.MULTILINE)
+
+# Two preview sheet buffers reused across redraws in turn (main thread only), so the sheet returned by
+# one call is still intact while the next one is drawn; each is replaced when the size changes
+_preview_scratch = [None, None]
+_preview_scratch_turn = 0
+
+# Printer list from the last successful _get_printers() call and when it was fetched (time.monotonic());
+# reopening the dialog shows it at once and only re-queries once it is older than PRINTERS_CACHE_TTL_S
+_printers_cache = None
+_printers_cache_time = 0.0
 
 
 def _mm_to_px(mm, dpi):
     return int(mm * dpi / 25.4)
 
 
+@functools.lru_cache(maxsize=64)
 def _compute_layout(rows, margin_mm, gap_mm):
     printable_w_mm = A4_W_MM - 2 * margin_mm
     printable_h_mm = A4_H_MM - 2 * margin_mm
     photo_w_mm = (printable_w_mm - (COLS - 1) * gap_mm) / COLS
-    photo_h_mm = photo_w_mm * ASPECT_H / ASPECT_W
+    photo_h_mm = photo_w_mm * _H_PER_W
     required_h = rows * photo_h_mm + (rows - 1) * gap_mm
     if required_h > printable_h_mm:
         photo_h_mm = (printable_h_mm - (rows - 1) * gap_mm) / rows
-        photo_w_mm = photo_h_mm * ASPECT_W / ASPECT_H
+        photo_w_mm = photo_h_mm / _H_PER_W
     return photo_w_mm, photo_h_mm
 
 
+@functools.lru_cache(maxsize=64)
 def _max_rows(margin_mm, gap_mm=GAP_MM):
     printable_h_mm = A4_H_MM - 2 * margin_mm
-    photo_w_mm, photo_h_mm = _compute_layout(1, margin_mm, gap_mm)
+    # Width-limited cell height (what _compute_layout(1, ...) gives unless one row alone overflows -> 1)
+    photo_h_mm = (A4_W_MM - 2 * margin_mm - (COLS - 1) * gap_mm) / COLS * _H_PER_W
     return max(1, int((printable_h_mm + gap_mm) / (photo_h_mm + gap_mm)))
 
 
-def build_a4_sheet(pil_photo, rows, dpi=PREVIEW_DPI, margin_mm=DEFAULT_MARGIN_MM, gap_mm=GAP_MM):
-    sheet_w_px = _mm_to_px(A4_W_MM, dpi)
-    sheet_h_px = _mm_to_px(A4_H_MM, dpi)
+@functools.lru_cache(maxsize=64)
+def _sheet_geometry(rows, dpi, margin_mm, gap_mm):
+    """Pixel layout of the sheet: (sheet_w, sheet_h, photo_w, photo_h, column x origins, row y origins)."""
     margin_px = _mm_to_px(margin_mm, dpi)
     gap_px = _mm_to_px(gap_mm, dpi)
     photo_w_mm, photo_h_mm = _compute_layout(rows, margin_mm, gap_mm)
     photo_w_px = _mm_to_px(photo_w_mm, dpi)
     photo_h_px = _mm_to_px(photo_h_mm, dpi)
+    # Every cell in a column shares x and every cell in a row shares y: COLS + rows ints, not a pair per cell
+    col_xs = tuple(range(margin_px, margin_px + COLS * (photo_w_px + gap_px), photo_w_px + gap_px))
+    row_ys = tuple(range(margin_px, margin_px + rows * (photo_h_px + gap_px), photo_h_px + gap_px))
+    return _mm_to_px(A4_W_MM, dpi), _mm_to_px(A4_H_MM, dpi), photo_w_px, photo_h_px, col_xs, row_ys
+
+
+def _blank_sheet(size, reuse_buffer=False):
+    """White RGB sheet. With reuse_buffer, repaint and return the next shared preview buffer instead of allocating."""
+    global _preview_scratch_turn
+    if not reuse_buffer:
+        return Image.new("RGB", size, "white")
+    _preview_scratch_turn ^= 1
+    buf = _preview_scratch[_preview_scratch_turn]
+    if buf is None or buf.size != size:
+        buf = _preview_scratch[_preview_scratch_turn] = Image.new("RGB", size, "white")
+    else:
+        buf.paste((255, 255, 255), (0, 0) + size)
+    return buf
+
+
+def build_a4_sheet(
+    pil_photo, rows, dpi=PREVIEW_DPI, margin_mm=DEFAULT_MARGIN_MM, gap_mm=GAP_MM,
+    thumb_cache=None, resample=Image.Resampling.LANCZOS, reuse_buffer=False,
+):
+    """
+    Tile pil_photo (RGB; convert once up front) over an A4 sheet.
+    Pass a dict as thumb_cache to reuse the resized cell across calls.
+    resample is the cell filter: LANCZOS for print, BILINEAR is plenty for the on-screen preview.
+    reuse_buffer draws into a shared preview buffer; the result stays valid through the next such call only.
+    """
+    sheet_w_px, sheet_h_px, photo_w_px, photo_h_px, col_xs, row_ys = _sheet_geometry(rows, dpi, margin_mm, gap_mm)
+
+    # LANCZOS is the expensive step; only redo it when the cell size changes (any DPI may hit)
+    key = (photo_w_px, photo_h_px, resample)
+    thumb = thumb_cache.pop(key, None) if thumb_cache is not None else None
+    if thumb is None:
+        sw, sh = pil_photo.size
+        if (sw, sh) == (photo_w_px, photo_h_px):
+            thumb = pil_photo  # already cell-sized (e.g. a pre-cropped passport photo)
+        elif max(abs(sw - photo_w_px), abs(sh - photo_h_px)) < 4:
+            # A few px off: any kernel looks the same, BILINEAR is the cheapest that still interpolates
+            thumb = pil_photo.resize((photo_w_px, photo_h_px), Image.Resampling.BILINEAR)
+        else:
+            # reducing_gap: large downscales box-reduce by an integer factor in C before the real filter
+            thumb = pil_photo.resize((photo_w_px, photo_h_px), resample, reducing_gap=3.0)
+    if thumb_cache is not None:
+        # Plain dict as LRU: (re)insert at the end, evict from the front
+        thumb_cache[key] = thumb
+        while len(thumb_cache) > THUMB_CACHE_SIZE:
+            del thumb_cache[next(iter(thumb_cache))]
+
+    # Tile a single row strip (COLS cells + gaps) in NumPy, then paste that strip once per row:
+    # COLS + rows block copies, and the only sheet-sized allocation is the PIL image itself
+    # (a NumPy sheet would be copied again by Image.fromarray, doubling peak memory at 300 DPI)
+    thumb_arr = np.asarray(thumb)
+    x0 = col_xs[0]
+    pitch = col_xs[1] - x0 if COLS > 1 else photo_w_px
+    strip_w = col_xs[-1] + photo_w_px - x0
+    # View the strip as (h, COLS, pitch) cells and broadcast the thumbnail into all of them at once
+    strip = np.full((photo_h_px, COLS * pitch, 3), 255, dtype=np.uint8)
+    strip.reshape(photo_h_px, COLS, pitch, 3)[:, :, :photo_w_px] = thumb_arr[:, None]
+    strip_img = Image.fromarray(strip[:, :strip_w], "RGB")
+    sheet = _blank_sheet((sheet_w_px, sheet_h_px), reuse_buffer)
+    for y in row_ys:
+        sheet.paste(strip_img, (x0, y))
+    return sheet
 
-    sheet = Image.new("RGB", (sheet_w_px, sheet_h_px), "white")
-    img = pil_photo.convert("RGB") if pil_photo.mode != "RGB" else pil_photo
-    thumb = img.resize((photo_w_px, photo_h_px), Image.Resampling.LANCZOS)
 
-    for row in range(rows):
-        for col in range(COLS):
-            x = margin_px + col * (photo_w_px + gap_px)
-            y = margin_px + row * (photo_h_px + gap_px)
-            sheet.paste(thumb, (x, y))
+def build_a4_placeholder(fill, rows, dpi=PREVIEW_DPI, margin_mm=DEFAULT_MARGIN_MM, gap_mm=GAP_MM, reuse_buffer=False):
+    """Same layout as build_a4_sheet but with flat `fill` cells; no resampling, for interactive feedback."""
+    sheet_w_px, sheet_h_px, photo_w_px, photo_h_px, col_xs, row_ys = _sheet_geometry(rows, dpi, margin_mm, gap_mm)
+    sheet = _blank_sheet((sheet_w_px, sheet_h_px), reuse_buffer)
+    draw = ImageDraw.Draw(sheet)
+    for y in row_ys:
+        for x in col_xs:
+            draw.rectangle((x, y, x + photo_w_px - 1, y + photo_h_px - 1), fill=fill)
     return sheet
 
 
+@functools.lru_cache(maxsize=1)
+def _win32():
+    """pywin32 + ImageWin imported once on first Windows printing use (never on other platforms)."""
+    import win32gui
+    import win32print
+    import win32ui
+    from PIL import ImageWin
+    return types.SimpleNamespace(print=win32print, ui=win32ui, gui=win32gui, ImageWin=ImageWin)
+
+
 def _get_printers():
     """Return list of (name, display_name) for dropdown. Raises on error (no fallback)."""
     if sys.platform == "darwin" or sys.platform.startswith("linux"):
@@ -76,18 +179,14 @@ def _get_printers():
         if out.returncode != 0:
             err = (out.stderr or out.stdout or "lpstat failed").strip()
             raise RuntimeError(f"Could not list printers: {err}")
-        names = []
-        for line in (out.stdout or "").strip().splitlines():
-            parts = line.split()
-            if len(parts) >= 2 and parts[0] == "printer":
-                names.append(parts[1])
+        names = _LPSTAT_PRINTER_RE.findall(out.stdout or "")
         if not names:
             raise RuntimeError("No printers found. Install CUPS / add a printer.")
         return [(n, n) for n in names]
 
     if sys.platform == "win32":
         try:
-            import win32print
+            win32print = _win32().print
         except ImportError as e:
             raise RuntimeError(
                 "pywin32 is required to list printers on Windows. "
@@ -131,6 +230,19 @@ def _get_printers():
     raise RuntimeError(f"Unsupported platform for printer list: {sys.platform}")
 
 
+def _printers_cache_fresh():
+    return _printers_cache is not None and time.monotonic() - _printers_cache_time < PRINTERS_CACHE_TTL_S
+
+
+def _get_printers_cached():
+    """_get_printers() memoized at module level for PRINTERS_CACHE_TTL_S (spawning lpstat / EnumPrinters is slow)."""
+    global _printers_cache, _printers_cache_time
+    if not _printers_cache_fresh():
+        _printers_cache = _get_printers()
+        _printers_cache_time = time.monotonic()
+    return _printers_cache
+
+
 def _open_system_print_dialog(path):
     """Open OS print dialog with the given image file."""
     try:
@@ -172,9 +284,22 @@ def _open_printer_settings_system():
         pass
 
 
+@functools.lru_cache(maxsize=1)
+def _device_caps_func():
+    """GetDeviceCaps resolved once: pywin32's if it exposes it, else gdi32 via ctypes."""
+    win32print = _win32().print
+    if hasattr(win32print, "GetDeviceCaps"):
+        return win32print.GetDeviceCaps
+    import ctypes
+    gdc = ctypes.windll.gdi32.GetDeviceCaps
+    gdc.argtypes = [ctypes.c_void_p, ctypes.c_int]
+    gdc.restype = ctypes.c_int
+    return gdc
+
+
 def _open_printer_properties_win32(printer_name, parent_hwnd=None):
     """Open printer properties dialog (DocumentProperties) for this print job. Returns modified DEVMODE or None."""
-    import win32print
+    win32print = _win32().print
     if not printer_name or printer_name == "default":
         return None
     hprinter = win32print.OpenPrinter(printer_name)
@@ -209,16 +334,33 @@ class A4PrintPreviewWindow(ctk.CTkToplevel):
         super().__init__(parent, **kwargs)
         self.title("Print — Passport photos on A4")
         self.pil_photo = pil_photo
+        # Convert once here; build_a4_sheet expects RGB so redraws never copy an RGBA source
+        self._rgb_source = pil_photo if pil_photo.mode == "RGB" else pil_photo.convert("RGB")
+        self._thumb_cache = {}  # (photo_w_px, photo_h_px, resample) -> resized cell
+        self._last_print_sheet = None  # ((rows, margin_mm, dpi), 300-DPI sheet)
+        self._last_print_path = None  # ((rows, margin_mm, dpi), temp PNG path)
+        # Preview cells never exceed the rows=1, margin=0 cell at the highest preview DPI, so shrink the
+        # source to that once; every preview resize then reads a few hundred px instead of the full photo
+        cell_w_mm, cell_h_mm = _compute_layout(1, 0.0, GAP_MM)
+        self._preview_source = self._rgb_source.copy()
+        self._preview_source.thumbnail(
+            (_mm_to_px(cell_w_mm, PRINT_DPI), _mm_to_px(cell_h_mm, PRINT_DPI)),
+            Image.Resampling.LANCZOS, reducing_gap=3.0,
+        )
+        # Mean colour of the photo, used for the flat cells drawn while the user is still editing
+        self._placeholder_fill = self._preview_source.resize((1, 1), Image.Resampling.BOX).getpixel((0, 0))
         self._sheet_image = None
+        self._sheet_key = None  # (rows, margin_mm, dpi) of the full-quality sheet on screen
         self._rows = 1
         self._margin_mm = DEFAULT_MARGIN_MM
         self._printer_error = None
         self._devmode = None  # Windows: DEVMODE from printer properties dialog
-        try:
-            self._printers = _get_printers()
-        except Exception as e:
-            self._printers = [("default", "Default printer")]
-            self._printer_error = str(e)
+        self._page_size_cache = {}  # Windows: printer name -> printable (width, height) px for current DEVMODE
+        self._redraw_job = None  # pending after() id for coalesced redraws
+        self._last_window_size = (0, 0)  # window size at the last full redraw
+        # Printers load on a worker thread (see _load_printers); a list cached by an earlier window shows
+        # immediately, and is refreshed in the background once stale
+        self._printers = _printers_cache or [("default", "Default printer")]
         self._max_rows_val = _max_rows(self._margin_mm)
 
         # Main horizontal split: left = preview, right = options
@@ -240,6 +382,7 @@ class A4PrintPreviewWindow(ctk.CTkToplevel):
         )
         self.preview_canvas.grid(row=0, column=0, sticky="nsew")
         self._photo = None  # keep ref so image is not garbage-collected
+        self._canvas_image_id = None
 
         # —— Right: options ——
         options_frame = ctk.CTkFrame(self, fg_color=("gray92", "gray18"), width=OPTIONS_PANEL_WIDTH, corner_radius=8, border_width=1, border_color=("gray80", "gray30"))
@@ -262,13 +405,14 @@ class A4PrintPreviewWindow(ctk.CTkToplevel):
         )
         self.printer_menu.grid(row=row, column=0, sticky="ew", padx=16, pady=(0, 4))
         row += 1
-        if self._printer_error:
-            self.printer_error_label = ctk.CTkLabel(
-                opts, text=self._printer_error, font=ctk.CTkFont(size=11),
-                text_color=("red", "#f87171"), wraplength=OPTIONS_PANEL_WIDTH - 32
-            )
-            self.printer_error_label.grid(row=row, column=0, sticky="w", padx=16, pady=(0, 12))
-            row += 1
+        # Hidden until printer loading reports an error
+        self.printer_error_label = ctk.CTkLabel(
+            opts, text="", font=ctk.CTkFont(size=11),
+            text_color=("red", "#f87171"), wraplength=OPTIONS_PANEL_WIDTH - 32
+        )
+        self.printer_error_label.grid(row=row, column=0, sticky="w", padx=16, pady=(0, 12))
+        self.printer_error_label.grid_remove()
+        row += 1
 
         # Margins (mm)
         ctk.CTkLabel(opts, text="Margin (mm):", font=ctk.CTkFont(size=13)).grid(row=row, column=0, sticky="w", padx=16, pady=(8, 4))
@@ -315,21 +459,62 @@ class A4PrintPreviewWindow(ctk.CTkToplevel):
         ctk.CTkButton(btn_frame, text="Close", command=self.destroy, width=80, height=40, corner_radius=8).pack(side="left")
 
         self._update_rows_hint()
+        if not _printers_cache_fresh():
+            self._load_printers()
         self._redraw()
         self.after(100, self._maximize)
         self.after(250, self._redraw)  # redraw after layout so preview fits and centers
         self.bind("<Configure>", self._on_resize)
-        self._resize_job = None
+
+    def _load_printers(self):
+        """List printers on a worker thread so lpstat / EnumPrinters never blocks the dialog opening."""
+        def run():
+            try:
+                printers, err = _get_printers_cached(), None
+            except Exception as e:
+                printers, err = None, str(e)
+            try:
+                self.after(0, lambda: self._on_printers_loaded(printers, err))
+            except Exception:
+                pass  # window already closed
+
+        threading.Thread(target=run, daemon=True).start()
+
+    def _on_printers_loaded(self, printers, err):
+        if not self.winfo_exists():
+            return
+        if not printers:
+            self._printer_error = err
+            self.printer_error_label.configure(text=err)
+            self.printer_error_label.grid()
+            return
+        self._printers = printers
+        self.printer_menu.configure(values=[p[1] for p in printers])
+        if self.printer_var.get() not in {p[0] for p in printers}:
+            self.printer_var.set(printers[0][0])
 
     def _on_resize(self, event):
         if event.widget != self:
             return
-        if self._resize_job:
-            self.after_cancel(self._resize_job)
-        self._resize_job = self.after(150, self._redraw_after_resize)
-
-    def _redraw_after_resize(self):
-        self._resize_job = None
+        # Moves and 1-2 px snaps also fire <Configure>; only redraw when the window size really changed
+        last_w, last_h = self._last_window_size
+        if abs(event.width - last_w) <= RESIZE_TOLERANCE_PX and abs(event.height - last_h) <= RESIZE_TOLERANCE_PX:
+            return
+        self._schedule_redraw(150, fast=False)
+
+    def _schedule_redraw(self, delay=250, fast=True):
+        """
+        Coalesce resizes and row/margin edits into one real redraw after `delay` ms.
+        fast=True first shows the layout immediately with flat cells.
+        """
+        if fast:
+            self._redraw_fast()
+        if self._redraw_job:
+            self.after_cancel(self._redraw_job)
+        self._redraw_job = self.after(delay, self._run_scheduled_redraw)
+
+    def _run_scheduled_redraw(self):
+        self._redraw_job = None
         self._redraw()
 
     def _maximize(self):
@@ -347,7 +532,8 @@ class A4PrintPreviewWindow(ctk.CTkToplevel):
     def _get_margin_mm(self):
         try:
             v = float(self.margin_entry.get().strip())
-            return max(0, min(25, v))
+            # Round so near-identical entries share the lru_cached layout helpers' keys
+            return round(max(0, min(25, v)), 2)
         except ValueError:
             return DEFAULT_MARGIN_MM
 
@@ -358,7 +544,7 @@ class A4PrintPreviewWindow(ctk.CTkToplevel):
         if self._rows > self._max_rows_val:
             self._rows = self._max_rows_val
             self.rows_label.configure(text=str(self._rows))
-        self._redraw()
+        self._schedule_redraw()
 
     def _update_rows_hint(self):
         self.rows_hint.configure(text=f"(max {self._max_rows_val})")
@@ -367,20 +553,16 @@ class A4PrintPreviewWindow(ctk.CTkToplevel):
         if self._rows > 1:
             self._rows -= 1
             self.rows_label.configure(text=str(self._rows))
-            self._redraw()
+            self._schedule_redraw()
 
     def _increase(self):
         if self._rows < self._max_rows_val:
             self._rows += 1
             self.rows_label.configure(text=str(self._rows))
-            self._redraw()
+            self._schedule_redraw()
 
-    def _redraw(self):
-        margin = self._get_margin_mm()
-        self._sheet_image = build_a4_sheet(self.pil_photo, self._rows, margin_mm=margin)
-        w, h = self._sheet_image.size
-        if w <= 0 or h <= 0:
-            return
+    def _preview_size(self):
+        """Return (dpi, cw, ch): canvas size and the DPI at which the A4 sheet fits it."""
         self.update_idletasks()
         # Use canvas size so preview is always clipped to visible area; scale to fit, center
         cw = max(1, self.preview_canvas.winfo_width())
@@ -388,14 +570,49 @@ class A4PrintPreviewWindow(ctk.CTkToplevel):
         if cw <= 10 or ch <= 10:
             cw = max(cw, self.winfo_width() - OPTIONS_PANEL_WIDTH - 24)
             ch = max(ch, self.winfo_height() - 24)
-        r = min(cw / w, ch / h)
-        dw = max(1, min(int(w * r), cw))
-        dh = max(1, min(int(h * r), ch))
-        disp = self._sheet_image.resize((dw, dh), Image.Resampling.LANCZOS)
-        self.preview_canvas.delete("all")
-        self._photo = ImageTk.PhotoImage(disp)
+        # Build the sheet at the DPI that exactly fits the canvas: no second resize of the whole sheet
+        fit_dpi = min(cw / A4_W_MM, ch / A4_H_MM) * 25.4
+        return max(MIN_PREVIEW_DPI, min(PRINT_DPI, fit_dpi)), cw, ch
+
+    def _show_sheet(self, sheet, cw, ch):
+        if self._photo is not None and (self._photo.width(), self._photo.height()) == sheet.size:
+            # Same size (rows/margin edit): write pixels into the existing Tk image instead of a new one
+            self._photo.paste(sheet)
+        else:
+            self._photo = ImageTk.PhotoImage(sheet)
+        # One canvas item for the life of the window: move/retarget it instead of delete("all") + create
         cx, cy = cw // 2, ch // 2
-        self.preview_canvas.create_image(cx, cy, image=self._photo, anchor="center")
+        if self._canvas_image_id is None:
+            self._canvas_image_id = self.preview_canvas.create_image(cx, cy, image=self._photo, anchor="center")
+        else:
+            self.preview_canvas.itemconfigure(self._canvas_image_id, image=self._photo)
+            self.preview_canvas.coords(self._canvas_image_id, cx, cy)
+
+    def _redraw(self):
+        margin = self._get_margin_mm()
+        dpi, cw, ch = self._preview_size()
+        self._last_window_size = (self.winfo_width(), self.winfo_height())
+        key = (self._rows, margin, dpi)
+        if key == self._sheet_key:
+            # Same sheet (e.g. resize while clamped at MIN/PRINT_DPI, or a no-op post-layout redraw):
+            # the pixels on screen are already right, only re-centre the canvas item
+            self.preview_canvas.coords(self._canvas_image_id, cw // 2, ch // 2)
+            return
+        self._sheet_key = key
+        self._sheet_image = build_a4_sheet(
+            self._preview_source, self._rows, dpi=dpi, margin_mm=margin,
+            thumb_cache=self._thumb_cache, resample=Image.Resampling.BILINEAR, reuse_buffer=True,
+        )
+        self._show_sheet(self._sheet_image, cw, ch)
+
+    def _redraw_fast(self):
+        """Layout-only preview (flat cells) shown while rows/margin are still changing."""
+        self._sheet_key = None  # the screen no longer shows a full-quality sheet
+        dpi, cw, ch = self._preview_size()
+        sheet = build_a4_placeholder(
+            self._placeholder_fill, self._rows, dpi=dpi, margin_mm=self._get_margin_mm(), reuse_buffer=True
+        )
+        self._show_sheet(sheet, cw, ch)
 
     def _open_printer_settings(self):
         """On Windows: open DocumentProperties dialog for selected printer and store DEVMODE. Else: open system prefs."""
@@ -409,6 +626,7 @@ class A4PrintPreviewWindow(ctk.CTkToplevel):
                 except Exception:
                     pass
                 self._devmode = _open_printer_properties_win32(printer, parent_hwnd)
+                self._page_size_cache.clear()  # paper/orientation may have changed
             except Exception:
                 _open_printer_settings_system()
         else:
@@ -416,9 +634,7 @@ class A4PrintPreviewWindow(ctk.CTkToplevel):
 
     def _print_direct_windows(self):
         """Print directly to selected printer. Uses DEVMODE from Printer settings so paper, quality, color, DPI, etc. are applied. Image fits to page."""
-        import win32print
-        import win32ui
-        from PIL import ImageWin
+        win32 = _win32()
 
         # GetDeviceCaps indices for printable area (pixels)
         HORZRES = 8
@@ -427,13 +643,7 @@ class A4PrintPreviewWindow(ctk.CTkToplevel):
         printer = self.printer_var.get()
         if not printer or printer == "default":
             return
-        margin = self._get_margin_mm()
-        sheet = build_a4_sheet(
-            self.pil_photo,
-            self._rows,
-            dpi=PRINT_DPI,
-            margin_mm=margin,
-        )
+        sheet = self._build_print_sheet()
         if sheet.mode != "RGB":
             sheet = sheet.convert("RGB")
 
@@ -444,16 +654,15 @@ class A4PrintPreviewWindow(ctk.CTkToplevel):
             # Create DC with user's DEVMODE so all settings apply (paper type, quality, color, DPI, orientation, etc.)
             if self._devmode is not None:
                 try:
-                    import win32gui
                     # CreateDC with DEVMODE = driver uses exactly these settings for this job
-                    raw_hdc = win32gui.CreateDC("WINSPOOL", printer, self._devmode)
+                    raw_hdc = win32.gui.CreateDC("WINSPOOL", printer, self._devmode)
                     if raw_hdc:
-                        hdc = win32ui.CreateDCFromHandle(raw_hdc)
+                        hdc = win32.ui.CreateDCFromHandle(raw_hdc)
                 except Exception:
                     pass
             if hdc is None:
                 # No DEVMODE or CreateDC failed: use default printer DC
-                hdc = win32ui.CreateDC()
+                hdc = win32.ui.CreateDC()
                 hdc.CreatePrinterDC(printer)
                 if self._devmode is not None:
                     try:
@@ -466,21 +675,24 @@ class A4PrintPreviewWindow(ctk.CTkToplevel):
 
             # Fit to page: draw image scaled to printer's printable area
             hdc_handle = hdc.GetHandleOutput()
-            try:
-                page_width = win32print.GetDeviceCaps(hdc_handle, HORZRES)
-                page_height = win32print.GetDeviceCaps(hdc_handle, VERTRES)
-            except AttributeError:
-                import ctypes
-                gdi32 = ctypes.windll.gdi32
-                page_width = gdi32.GetDeviceCaps(hdc_handle, HORZRES)
-                page_height = gdi32.GetDeviceCaps(hdc_handle, VERTRES)
-            if page_width <= 0:
-                page_width = sheet.width
-            if page_height <= 0:
-                page_height = sheet.height
-
-            dib = ImageWin.Dib(sheet)
-            dib.draw(hdc.GetHandleOutput(), (0, 0, page_width, page_height))
+            page_size = self._page_size_cache.get(printer)
+            if page_size is None:
+                get_device_caps = _device_caps_func()
+                page_width = get_device_caps(hdc_handle, HORZRES)
+                page_height = get_device_caps(hdc_handle, VERTRES)
+                if page_width <= 0:
+                    page_width = sheet.width
+                if page_height <= 0:
+                    page_height = sheet.height
+                page_size = self._page_size_cache[printer] = (page_width, page_height)
+            page_width, page_height = page_size
+            if page_width <= sheet.width and page_height <= sheet.height and (page_width, page_height) != sheet.size:
+                # Downscale in Pillow so GDI blits 1:1 instead of running StretchDIBits over the full sheet.
+                # A larger page (high-DPI driver) is left to the driver: upscaling here would only grow the DIB.
+                sheet = sheet.resize((page_width, page_height), Image.Resampling.LANCZOS, reducing_gap=3.0)
+
+            dib = win32.ImageWin.Dib(sheet)
+            dib.draw(hdc_handle, (0, 0, page_width, page_height))
 
             hdc.EndPage()
             hdc.EndDoc()
@@ -488,8 +700,7 @@ class A4PrintPreviewWindow(ctk.CTkToplevel):
             # DeleteDC: only one of these (raw_hdc owns the DC when we used CreateDC with DEVMODE)
             if raw_hdc is not None:
                 try:
-                    import win32gui
-                    win32gui.DeleteDC(raw_hdc)
+                    win32.gui.DeleteDC(raw_hdc)
                 except Exception:
                     pass
             elif hdc is not None:
@@ -498,6 +709,41 @@ class A4PrintPreviewWindow(ctk.CTkToplevel):
                 except Exception:
                     pass
 
+    def _print_key(self):
+        return (self._rows, self._get_margin_mm(), PRINT_DPI)
+
+    def _build_print_sheet(self):
+        """300-DPI sheet for the current rows/margin; reused while those settings are unchanged."""
+        key = self._print_key()
+        if self._last_print_sheet is None or self._last_print_sheet[0] != key:
+            sheet = build_a4_sheet(
+                self._rgb_source, self._rows, dpi=PRINT_DPI, margin_mm=key[1], thumb_cache=self._thumb_cache
+            )
+            self._last_print_sheet = (key, sheet)
+        return self._last_print_sheet[1]
+
+    def _save_print_sheet(self):
+        """Save the print sheet to a temp PNG; repeat prints with unchanged settings reuse the same file."""
+        key = self._print_key()
+        if self._last_print_path is not None:
+            last_key, last_path = self._last_print_path
+            if last_key == key and os.path.exists(last_path):
+                return last_path
+        sheet_300 = self._build_print_sheet()
+        fd, path = tempfile.mkstemp(suffix=".png")
+        try:
+            os.close(fd)
+            # Transient file for the OS print dialog: level-1 deflate is several times faster than the default
+            sheet_300.save(path, format="PNG", compress_level=1, optimize=False)
+        except Exception:
+            try:
+                os.unlink(path)
+            except Exception:
+                pass
+            raise
+        self._last_print_path = (key, path)
+        return path
+
     def _print_with_dialog(self):
         """Windows: print silently to selected printer with stored DEVMODE. Other OSes: open system print dialog."""
         if self.pil_photo is None:
@@ -505,44 +751,21 @@ class A4PrintPreviewWindow(ctk.CTkToplevel):
         if sys.platform == "win32":
             try:
                 self._print_direct_windows()
+                return
             except Exception:
-                # Fallback: save and open shell print dialog
-                margin = self._get_margin_mm()
-                sheet_300 = build_a4_sheet(self.pil_photo, self._rows, dpi=PRINT_DPI, margin_mm=margin)
-                fd, path = tempfile.mkstemp(suffix=".png")
-                try:
-                    os.close(fd)
-                    sheet_300.save(path)
-                    _open_system_print_dialog(path)
-                except Exception:
-                    try:
-                        os.unlink(path)
-                    except Exception:
-                        pass
-        else:
-            margin = self._get_margin_mm()
-            sheet_300 = build_a4_sheet(self.pil_photo, self._rows, dpi=PRINT_DPI, margin_mm=margin)
-            fd, path = tempfile.mkstemp(suffix=".png")
-            try:
-                os.close(fd)
-                sheet_300.save(path)
-                _open_system_print_dialog(path)
-            except Exception:
-                try:
-                    os.unlink(path)
-                except Exception:
-                    pass
+                pass  # Fallback: save and open shell print dialog
+        try:
+            path = self._save_print_sheet()
+        except Exception:
+            return
+        _open_system_print_dialog(path)
 
     def _print_direct(self):
         """Print directly to selected printer (no dialog). Kept for fallback."""
         if self._sheet_image is None:
             return
-        margin = self._get_margin_mm()
-        sheet_300 = build_a4_sheet(self.pil_photo, self._rows, dpi=PRINT_DPI, margin_mm=margin)
-        fd, path = tempfile.mkstemp(suffix=".png")
+        path = self._save_print_sheet()
         try:
-            os.close(fd)
-            sheet_300.save(path)
             printer = self.printer_var.get()
             if sys.platform == "win32":
                 os.startfile(path, "print")
@@ -552,6 +775,7 @@ class A4PrintPreviewWindow(ctk.CTkToplevel):
                 else:
                     subprocess.run(["lp", path], check=False)
         finally:
+            self._last_print_path = None
             try:
                 os.unlink(path)
             except Exception:
@@ -3,10 +3,11 @@ Gemini API for background color suggestion only (no auto crop).
 Uses gemini-2.5-flash (free tier 2026); fallback to gemini-2.0-flash if 404.
 google.generativeai is lazy-imported on first use for faster app startup.
 """
+import io
 import json
 import logging
 import os
-from pathlib import Path
+import re
 
 from PIL import Image
 
@@ -14,6 +15,8 @@ logger = logging.getLogger(__name__)
 
 THUMBNAIL_MAX_SIZE = 512
 MODEL_NAMES = ("gemini-2.5-flash", "gemini-2.0-flash", "gemini-1.5-flash")
+# "bg_color": "#RRGGBB" anywhere in the reply, with or without a ```json fence around it
+_BG_COLOR_RE = re.compile(r'"bg_color"\s*:\s*"(#[0-9A-Fa-f]{6}|#[0-9A-Fa-f]{3})"')
 
 
 def _ensure_genai_configured(instance):
@@ -27,7 +30,7 @@ def _ensure_genai_configured(instance):
         api_key = os.getenv("GOOGLE_API_KEY")
         if api_key:
             genai.configure(api_key=api_key)
-            instance.model = genai.GenerativeModel(MODEL_NAMES[0])
+            instance.model = instance._get_model(MODEL_NAMES[0])
             return True
         print("Warning: GOOGLE_API_KEY not found in .env")
     except Exception as e:
@@ -38,14 +41,46 @@ def _ensure_genai_configured(instance):
 class AILogic:
     def __init__(self):
         self.model = None  # set on first suggest_background_color call
+        self._models = {}  # model name -> genai.GenerativeModel, reused across calls and fallbacks
 
-    def _create_thumbnail(self, image_path, out_path, max_size=THUMBNAIL_MAX_SIZE):
-        img = Image.open(image_path).convert("RGB")
+    def _get_model(self, name):
+        model = self._models.get(name)
+        if model is None:
+            import google.generativeai as genai
+            model = self._models[name] = genai.GenerativeModel(name)
+        return model
+
+    def _create_thumbnail(self, image_path, max_size=THUMBNAIL_MAX_SIZE):
+        img = Image.open(image_path)
+        # For JPEGs, let libjpeg decode at 1/2, 1/4 or 1/8 scale instead of decoding full size
+        # and resizing down; no-op for other formats.
+        img.draft("RGB", (max_size, max_size))
+        img = img.convert("RGB")
         img.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
-        img.save(out_path, "JPEG", quality=85)
-        return img.size
+        return img
+
+    def _thumbnail_from_pil(self, pil_image, max_size=THUMBNAIL_MAX_SIZE):
+        """
+        RGB thumbnail of an in-memory image (never enlarged). Resizes straight from the source instead of
+        copying the full-size crop first; reducing_gap box-reduces before the LANCZOS pass, as thumbnail() does.
+        """
+        scale = min(1.0, max_size / max(pil_image.size))
+        size = (max(1, round(pil_image.width * scale)), max(1, round(pil_image.height * scale)))
+        if pil_image.mode != "RGB":
+            pil_image = pil_image.convert("RGB")
+        return pil_image.resize(size, Image.Resampling.LANCZOS, reducing_gap=2.0)
+
+    def _encode_jpeg(self, img):
+        """JPEG bytes for an inline generate_content part (no temp file, no Files API upload)."""
+        buf = io.BytesIO()
+        img.save(buf, "JPEG", quality=85)
+        return buf.getvalue()
 
     def _parse_json_response(self, text):
+        m = _BG_COLOR_RE.search(text)
+        if m:
+            return {"bg_color": m.group(1)}
+        # Unexpected shape: strip any markdown fence and parse the full JSON
         text = text.strip()
         if "```json" in text:
             start = text.index("```json") + 7
@@ -60,30 +95,20 @@ class AILogic:
     def suggest_background_color(self, image_path=None, pil_image=None):
         """
         Sends a low-res thumbnail to Gemini. Returns only bg_color (hex string).
-        Pass image_path=... or pil_image=... (PIL Image); if pil_image, saves to temp first.
+        Pass image_path=... or pil_image=... (PIL Image); the thumbnail is sent inline as JPEG bytes.
         Tries gemini-2.5-flash first; on 404 falls back to gemini-2.0-flash, then gemini-1.5-flash.
         """
         if not _ensure_genai_configured(self) or (image_path is None and pil_image is None):
             return None
-        import google.generativeai as genai
-        temp_dir = Path(__file__).resolve().parent.parent / "assets" / "temp"
-        temp_dir.mkdir(parents=True, exist_ok=True)
-        thumb_path = temp_dir / "gemini_thumb.jpg"
         try:
             if pil_image is not None:
-                img = pil_image.convert("RGB").copy()
-                img.thumbnail((THUMBNAIL_MAX_SIZE, THUMBNAIL_MAX_SIZE), Image.Resampling.LANCZOS)
-                img.save(str(thumb_path), "JPEG", quality=85)
+                img = self._thumbnail_from_pil(pil_image)
             else:
-                self._create_thumbnail(image_path, str(thumb_path))
+                img = self._create_thumbnail(image_path)
+            thumb_part = {"mime_type": "image/jpeg", "data": self._encode_jpeg(img)}
         except Exception as e:
             print(f"Thumbnail error: {e}")
             return None
-        try:
-            thumb_file = genai.upload_file(path=str(thumb_path), display_name="PassportThumb")
-        finally:
-            if thumb_path.exists():
-                thumb_path.unlink(missing_ok=True)
         prompt = """You are an expert in color theory and portrait photography. Analyze this passport/ID-style portrait.
 
 **Step 1: Observe:**
@@ -99,8 +124,8 @@ Return ONLY a single JSON object with one key: "bg_color" (string, hex including
 Example: {"bg_color": "#E8EEF2"}"""
         for name in MODEL_NAMES:
             try:
-                model = self.model if name == MODEL_NAMES[0] else genai.GenerativeModel(name)
-                response = model.generate_content([thumb_file, prompt])
+                model = self._get_model(name)
+                response = model.generate_content([thumb_part, prompt])
                 result = self._parse_json_response(response.text)
                 bg_color = result.get("bg_color") or "#FFFFFF"
                 logger.info("Gemini background color suggestion: model=%s, bg_color=%s", name, bg_color)
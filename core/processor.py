@@ -3,10 +3,15 @@ Image processing: crop, background removal, background color, optional border, e
 Triple-model removal: u2net_human_seg + u2net + u2net_cloth_seg run in parallel.
 Heavy deps (rembg, cv2, numpy) are lazy-imported for faster app startup.
 """
+import functools
+import gc
 import io
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from PIL import Image, ImageColor, ImageOps
+from PIL import Image, ImageColor
 
 BORDER_PX = 10  # 10px professional border (5 white + 5 black) when enabled
 
@@ -14,50 +19,186 @@ BORDER_PX = 10  # 10px professional border (5 white + 5 black) when enabled
 _REMBG_SESSION_A = None   # u2net_human_seg – portrait/body
 _REMBG_SESSION_B = None  # u2net – general
 _REMBG_SESSION_C = None  # u2net_cloth_seg – clothing and edges
+_rembg_sessions_last_used = 0.0  # time.monotonic() of the last session lookup, for release_idle_sessions
+
+# One worker per model: onnxruntime releases the GIL in session.run, so the three passes overlap
+_MASK_POOL = ThreadPoolExecutor(max_workers=3, thread_name_prefix="rembg-mask")
+
+
+@functools.lru_cache(maxsize=1)
+def _ort_providers():
+    """ONNX Runtime providers to use: a GPU one first if this onnxruntime build has it, CPU always last."""
+    import onnxruntime as ort
+    available = ort.get_available_providers()
+    providers = []
+    if "CUDAExecutionProvider" in available:
+        # Grow the CUDA arena only by what each run asks for instead of doubling (three models share the GPU)
+        providers.append(("CUDAExecutionProvider", {"device_id": 0, "arena_extend_strategy": "kSameAsRequested"}))
+    if "DmlExecutionProvider" in available:  # DirectML: any DX12 GPU on Windows
+        providers.append("DmlExecutionProvider")
+    providers.append("CPUExecutionProvider")
+    return providers
+
+
+@functools.lru_cache(maxsize=1)
+def _ort_session_options():
+    """
+    SessionOptions shared by the three sessions. They run concurrently (get_masks_parallel), so each
+    gets a third of the cores instead of ORT's default of all of them (3x oversubscription).
+    """
+    import onnxruntime as ort
+    so = ort.SessionOptions()
+    so.intra_op_num_threads = max(1, (os.cpu_count() or 3) // 3)
+    so.inter_op_num_threads = 1
+    so.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+    so.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    so.enable_mem_pattern = True  # fixed input shapes: reuse the planned allocations every run
+    so.enable_cpu_mem_arena = True
+    return so
+
+
+def _new_session(name, **kwargs):
+    """
+    rembg session on the preferred providers with _ort_session_options. Mirrors rembg.new_session (which
+    builds its own default SessionOptions); falls back to it on rembg versions with another layout.
+    """
+    from rembg import new_session
+    try:
+        from rembg.sessions import sessions_class
+        from rembg.sessions.u2net import U2netSession
+        session_class = next((sc for sc in sessions_class if sc.name() == name), U2netSession)
+        return session_class(name, _ort_session_options(), providers=_ort_providers(), **kwargs)
+    except (ImportError, TypeError, AttributeError):
+        pass
+    try:
+        return new_session(name, providers=_ort_providers(), **kwargs)
+    except TypeError:
+        return new_session(name, **kwargs)
+
+
+def _new_u2net_session(name):
+    """rembg session for a U²-Net model, using its int8 copy if core.quantize_models has written one."""
+    try:
+        from core.quantize_models import int8_model_path
+        int8_path = int8_model_path(name)
+        if int8_path.exists():
+            return _new_session("u2net_custom", model_path=str(int8_path))
+    except Exception:
+        pass  # older rembg without u2net_custom, or unreadable file: use the stock model
+    return _new_session(name)
 
 
 def _get_rembg_session_a():
     """Lazy-load u2net_human_seg for portrait foreground."""
-    global _REMBG_SESSION_A
+    global _REMBG_SESSION_A, _rembg_sessions_last_used
+    _rembg_sessions_last_used = time.monotonic()
     if _REMBG_SESSION_A is None:
-        from rembg import new_session
-        _REMBG_SESSION_A = new_session("u2net_human_seg")
+        _REMBG_SESSION_A = _new_u2net_session("u2net_human_seg")
     return _REMBG_SESSION_A
 
 
 def _get_rembg_session_b():
     """Lazy-load u2net for second opinion on foreground."""
-    global _REMBG_SESSION_B
+    global _REMBG_SESSION_B, _rembg_sessions_last_used
+    _rembg_sessions_last_used = time.monotonic()
     if _REMBG_SESSION_B is None:
-        from rembg import new_session
-        _REMBG_SESSION_B = new_session("u2net")
+        _REMBG_SESSION_B = _new_u2net_session("u2net")
     return _REMBG_SESSION_B
 
 
 def _get_rembg_session_c():
     """Lazy-load u2net_cloth_seg for clothing and edge detection."""
-    global _REMBG_SESSION_C
+    global _REMBG_SESSION_C, _rembg_sessions_last_used
+    _rembg_sessions_last_used = time.monotonic()
     if _REMBG_SESSION_C is None:
-        from rembg import new_session
-        _REMBG_SESSION_C = new_session("u2net_cloth_seg")
+        _REMBG_SESSION_C = _new_session("u2net_cloth_seg")
     return _REMBG_SESSION_C
 
 
+def release_idle_sessions(idle_secs):
+    """
+    Drop the three rembg sessions (hundreds of MB of weights and ORT arenas) if none was used for idle_secs;
+    the next request reloads them lazily. Caller must ensure no inference is running. Returns True if released.
+    """
+    global _REMBG_SESSION_A, _REMBG_SESSION_B, _REMBG_SESSION_C
+    if _REMBG_SESSION_A is None and _REMBG_SESSION_B is None and _REMBG_SESSION_C is None:
+        return False
+    if time.monotonic() - _rembg_sessions_last_used < idle_secs:
+        return False
+    _REMBG_SESSION_A = _REMBG_SESSION_B = _REMBG_SESSION_C = None
+    gc.collect()
+    return True
+
+
+# rembg's U2netSession input: 320x320, ImageNet mean/std (u2net and u2net_human_seg share it)
+_U2NET_SIZE = (320, 320)
+_U2NET_MEAN = (0.485, 0.456, 0.406)
+_U2NET_STD = (0.229, 0.224, 0.225)
+
+
+def _u2net_input(img):
+    """Normalized (1, 3, 320, 320) float32 tensor for an RGB PIL image, as U2netSession.normalize builds it."""
+    import numpy as np
+    arr = np.asarray(img.resize(_U2NET_SIZE, Image.Resampling.LANCZOS), dtype=np.float32)
+    arr /= max(float(arr.max()), 1e-6)
+    arr -= np.array(_U2NET_MEAN, dtype=np.float32)
+    arr /= np.array(_U2NET_STD, dtype=np.float32)
+    return np.ascontiguousarray(arr.transpose(2, 0, 1)[None])
+
+
+def _u2net_mask(get_session, img, tensor):
+    """U²-Net mask for img from a precomputed _u2net_input tensor; same output as session.predict(img)[0]."""
+    session = get_session()
+    inner = getattr(session, "inner_session", None)
+    if inner is None:
+        masks = session.predict(img)
+        return masks[0] if masks else None
+    import numpy as np
+    # Fetch only d0, the fused mask rembg uses; the six side outputs aren't copied out
+    pred = inner.run([inner.get_outputs()[0].name], {inner.get_inputs()[0].name: tensor})[0][0, 0]
+    lo, hi = pred.min(), pred.max()
+    pred = (pred - lo) / (hi - lo) if hi > lo else np.zeros_like(pred)
+    pred = (pred * 255).astype(np.uint8)
+    mask = Image.frombuffer("L", pred.shape[::-1], pred, "raw", "L", 0, 1)  # wraps the array, no copy
+    return mask.resize(img.size, Image.Resampling.LANCZOS)
+
+
+def _fast_feather_cutout(img, mask, erode_iterations=2, blur_px=7):
+    """
+    RGBA cutout with a feathered edge: erode the uint8 mask slightly (drops the background fringe),
+    then Gaussian-blur it into a soft alpha. A fraction of alpha matting's cost on large images.
+    """
+    import cv2
+    import numpy as np
+    alpha = cv2.erode(mask, np.ones((3, 3), np.uint8), iterations=erode_iterations)
+    alpha = cv2.GaussianBlur(alpha, (blur_px, blur_px), 0)
+    rgba = np.dstack((np.asarray(img), alpha))
+    return Image.frombuffer("RGBA", img.size, rgba, "raw", "RGBA", 0, 1)
+
+
+FACE_DETECT_MAX_SIDE = 640  # Haar cost is linear in pixels; faces in a portrait stay well above minSize
+
+
+@functools.lru_cache(maxsize=1)
+def _face_cascade():
+    """Frontal-face Haar cascade, parsed from XML once per process."""
+    import cv2
+    return cv2.CascadeClassifier(cv2.data.haarcascades + "haarcascade_frontalface_default.xml")
+
+
 def _head_chest_from_face_opencv(pil_image_rgba):
     """Fallback: OpenCV face → head/chest coords. Used only if needed elsewhere."""
     try:
         import cv2
         import numpy as np
-        rgb = pil_image_rgba.convert("RGB")
-        arr = np.array(rgb)
-        gray = cv2.cvtColor(arr, cv2.COLOR_RGB2GRAY)
+        gray = np.asarray(pil_image_rgba.convert("L"))
         h, w = gray.shape
-        cascade_path = cv2.data.haarcascades + "haarcascade_frontalface_default.xml"
-        face_cascade = cv2.CascadeClassifier(cascade_path)
-        faces = face_cascade.detectMultiScale(gray, scaleFactor=1.1, minNeighbors=5, minSize=(30, 30))
+        scale = min(1.0, FACE_DETECT_MAX_SIDE / max(h, w))
+        small = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA) if scale < 1.0 else gray
+        faces = _face_cascade().detectMultiScale(small, scaleFactor=1.1, minNeighbors=5, minSize=(30, 30))
         if len(faces) == 0:
             return None
-        x, y, fw, fh = max(faces, key=lambda r: r[2] * r[3])
+        x, y, fw, fh = (v / scale for v in max(faces, key=lambda r: r[2] * r[3]))
         head_top = max(0, int(y - 0.3 * fh))
         chest_bottom = min(h, int(y + fh * 2.2))
         return {"head_top": head_top, "chest_bottom": chest_bottom}
@@ -111,6 +252,21 @@ class ImageProcessor:
         masks = session.predict(img)
         return masks[0] if masks else None
 
+    def get_masks_parallel(self, pil_image):
+        """Run the three models concurrently on one RGB conversion. Returns (mask_a, mask_b, mask_cloth)."""
+        if pil_image is None:
+            return None, None, None
+        img = pil_image.convert("RGB") if pil_image.mode != "RGB" else pil_image
+        # u2net_human_seg and u2net take the identical input: resize/normalize once for both
+        tensor = _u2net_input(img)
+        futures = [
+            _MASK_POOL.submit(_u2net_mask, _get_rembg_session_a, img, tensor),
+            _MASK_POOL.submit(_u2net_mask, _get_rembg_session_b, img, tensor),
+            _MASK_POOL.submit(self.get_mask_cloth, img),  # cloth model has its own 768px preprocessing
+        ]
+        mask_a, mask_b, mask_cloth = (f.result() for f in futures)
+        return mask_a, mask_b, mask_cloth
+
     def combine_masks_and_cutout(
         self,
         pil_image,
@@ -122,11 +278,14 @@ class ImageProcessor:
         alpha_matting_bg_threshold=10,
         alpha_matting_erode_size=8,
         post_process_mask=True,
+        quality="fast",
     ):
         """
         Combine foreground masks and cut out the subject.
         Base = (mask_a ∩ mask_b). If mask_cloth is provided: combined = base ∪ cloth
         so clothing and edges from the cloth model are included. Returns RGBA PIL.
+        With alpha_matting, quality="fast" feathers the mask edge (erode + blur);
+        quality="max" runs rembg's PyMatting alpha matting, which is much slower on large images.
         """
         if pil_image is None or mask_a is None or mask_b is None:
             return None
@@ -134,22 +293,27 @@ class ImageProcessor:
         # Ensure same size
         if mask_a.size != mask_b.size:
             mask_b = mask_b.resize(mask_a.size, Image.Resampling.LANCZOS)
+        import cv2  # rembg itself depends on OpenCV
         import numpy as np
         from rembg.bg import alpha_matting_cutout, naive_cutout, post_process as rembg_post_process
-        a = np.array(mask_a, dtype=np.float32)
-        b = np.array(mask_b, dtype=np.float32)
-        base = np.minimum(a, b)
+        # min/max never leave 0..255, so stay in uint8 (no float copies, no clip/astype passes);
+        # cv2.min/max run OpenCV's vectorized uint8 kernels
+        combined = cv2.min(np.asarray(mask_a), np.asarray(mask_b))
         if mask_cloth is not None:
             if mask_cloth.size != mask_a.size:
                 mask_cloth = mask_cloth.resize(mask_a.size, Image.Resampling.LANCZOS)
-            cloth = np.array(mask_cloth, dtype=np.float32)
             # Include clothing/edges: keep pixel if (body) or (cloth says foreground)
-            combined = np.maximum(base, cloth).clip(0, 255).astype(np.uint8)
-        else:
-            combined = base.clip(0, 255).astype(np.uint8)
-        combined_pil = Image.fromarray(combined, mode="L")
+            cv2.max(combined, np.asarray(mask_cloth), dst=combined)
         if post_process_mask:
-            combined_pil = Image.fromarray(rembg_post_process(combined))
+            combined = rembg_post_process(combined)
+        if alpha_matting and quality != "max" and combined.shape == (img.height, img.width):
+            try:
+                return _fast_feather_cutout(img, np.ascontiguousarray(combined))
+            except Exception:
+                pass  # fall through to rembg's cutouts
+        # Only PIL wrap of the mask, for the cutout functions; frombuffer shares the array's memory
+        combined = np.ascontiguousarray(combined, dtype=np.uint8)
+        combined_pil = Image.frombuffer("L", combined.shape[::-1], combined, "raw", "L", 0, 1)
         try:
             if alpha_matting:
                 cutout = alpha_matting_cutout(
@@ -213,6 +377,16 @@ class ImageProcessor:
             return pil_image
         w, h = pil_image.size
         new_w, new_h = int(w * factor), int(h * factor)
+        if pil_image.mode in ("RGB", "RGBA", "L"):
+            try:
+                import cv2
+                import numpy as np
+                # OpenCV's Lanczos is SIMD-vectorized and multithreaded; Pillow's runs on one core
+                out = cv2.resize(np.asarray(pil_image), (new_w, new_h), interpolation=cv2.INTER_LANCZOS4)
+                # frombuffer wraps L/RGBA output without a copy (Pillow still repacks RGB to 4 bytes/px)
+                return Image.frombuffer(pil_image.mode, (new_w, new_h), out, "raw", pil_image.mode, 0, 1)
+            except ImportError:
+                pass
         return pil_image.resize((new_w, new_h), Image.Resampling.LANCZOS)
 
     def apply_background(self, pil_rgba, bg_hex):
@@ -225,11 +399,13 @@ class ImageProcessor:
             bg_rgb = ImageColor.getrgb(bg_hex)
         else:
             bg_rgb = (255, 255, 255)
-        w, h = pil_rgba.size
-        canvas = Image.new("RGBA", (w, h), bg_rgb)
-        canvas.paste(pil_rgba, (0, 0), pil_rgba)
-        out = Image.new("RGB", (w, h), bg_rgb)
-        out.paste(canvas, mask=pil_rgba.split()[3])
+        if pil_rgba.mode != "RGBA":
+            pil_rgba = pil_rgba.convert("RGBA")
+        if pil_rgba.getextrema()[3] == (255, 255):
+            return pil_rgba.convert("RGB")  # fully opaque: background never shows
+        # One alpha-over composite straight into the RGB result (the RGBA pixels' own alpha is the mask)
+        out = Image.new("RGB", pil_rgba.size, bg_rgb)
+        out.paste(pil_rgba, (0, 0), pil_rgba)
         return out
 
     def add_border(self, pil_image, border_px=0):
@@ -240,9 +416,12 @@ class ImageProcessor:
         if pil_image is None or border_px <= 0:
             return pil_image.convert("RGB") if pil_image else None
         half = border_px // 2
-        img = ImageOps.expand(pil_image, border=half, fill="white")
-        img = ImageOps.expand(img, border=half, fill="black")
-        return img.convert("RGB")
+        w, h = pil_image.size
+        # One canvas: black fill, white inner ring, photo on top (was two expand copies + a convert)
+        out = Image.new("RGB", (w + 4 * half, h + 4 * half), "black")
+        out.paste((255, 255, 255), (half, half, w + 3 * half, h + 3 * half))
+        out.paste(pil_image if pil_image.mode == "RGB" else pil_image.convert("RGB"), (2 * half, 2 * half))
+        return out
 
     def export_png(self, pil_image, save_path):
         if pil_image is None:
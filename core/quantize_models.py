@@ -0,0 +1,50 @@
+"""
+Optional one-time int8 quantization of the rembg U²-Net models (run after the models are downloaded):
+
+    python -m core.quantize_models
+
+Writes <name>_int8.onnx next to the fp32 models in the app model folder; core.processor loads those
+instead when present (int8 matmuls/convs are typically 2-4x faster on CPU, files ~4x smaller).
+Delete the *_int8.onnx files to go back to the fp32 models.
+u2net_cloth_seg is left as is: rembg can only load a custom model file for plain U²-Net outputs.
+"""
+import os
+import sys
+from pathlib import Path
+
+# Use app-local model dir only (same folder rembg downloads into)
+from installer import get_rembg_model_dir
+os.environ.setdefault("U2NET_HOME", str(get_rembg_model_dir()))
+
+QUANTIZED_MODELS = ("u2net_human_seg", "u2net")
+
+
+def int8_model_path(name):
+    """Where the int8 copy of model `name` lives (may not exist)."""
+    return Path(os.environ["U2NET_HOME"]) / f"{name}_int8.onnx"
+
+
+def quantize_models(force=False):
+    """Dynamically quantize each fp32 model in QUANTIZED_MODELS to int8. Returns the paths written."""
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+    written = []
+    for name in QUANTIZED_MODELS:
+        src = Path(os.environ["U2NET_HOME"]) / f"{name}.onnx"
+        dst = int8_model_path(name)
+        if not src.exists():
+            print(f"Skipping {name}: {src} not found (run the app once to download models)")
+            continue
+        if dst.exists() and not force:
+            continue
+        quantize_dynamic(str(src), str(dst), weight_type=QuantType.QInt8)
+        written.append(dst)
+    return written
+
+
+def main():
+    for path in quantize_models(force="--force" in sys.argv):
+        print(f"Wrote {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@ Ensures only one service runs: fixed port, start lock file, and wait for port af
 import io
 import os
 import socket
+import struct
 import subprocess
 import sys
 import threading
@@ -23,41 +24,104 @@ _PORT_CHECK_INTERVAL = 1.0  # seconds between port checks
 # Only one thread per process may run "start" logic; avoid multiple service processes
 _start_lock = threading.Lock()
 
+# Raw-pixel framing (no PNG encode/decode on loopback): 16-byte header, then width*height*bpp bytes.
+# Request: FRAME_RAW_RGB + RGB pixels. Reply: FRAME_RAW_RGBA + RGBA pixels, or width=height=0 on failure.
+# A legacy request starts with a 4-byte image length instead; the magic reads as a length > 50 MB there.
+FRAME_MAGIC = b"PPRW"
+FRAME_HEADER = struct.Struct(">4sBII3x")  # magic, kind, width, height, padding
+FRAME_RAW_RGB = 1
+FRAME_RAW_RGBA = 2
+FRAME_MAX_PIXELS = 40_000_000
+
+
+def encode_lossless(img):
+    """
+    Lossless bytes for the length-prefixed (non-raw) exchange: fast lossless WebP, PNG if this Pillow
+    lacks WebP or the image exceeds WebP's 16383 px limit. Either side decodes with Image.open.
+    """
+    out = io.BytesIO()
+    try:
+        img.save(out, "WEBP", lossless=True, quality=0, method=0, exact=True)
+    except (KeyError, OSError, ValueError):
+        out = io.BytesIO()
+        img.save(out, "PNG", compress_level=1)
+    return out.getvalue()
+
+
+def _recv_exact(sock, n):
+    """Read exactly n bytes into one preallocated buffer, or fewer if the peer closes first."""
+    buf = bytearray(n)
+    view = memoryview(buf)
+    got = 0
+    while got < n:
+        k = sock.recv_into(view[got:], n - got)
+        if not k:
+            return buf[:got]
+        got += k
+    return buf
+
+
+def _remove_background_raw(img, port):
+    """
+    Raw-frame exchange. Returns RGBA image, None on service-side failure, or False if the service
+    closed without replying (an older service without raw frames) so the caller can use the length-prefixed exchange.
+    """
+    w, h = img.size
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(SOCKET_TIMEOUT)
+        sock.connect((REMBG_SERVICE_HOST, port))
+        try:
+            sock.sendall(FRAME_HEADER.pack(FRAME_MAGIC, FRAME_RAW_RGB, w, h))
+            sock.sendall(img.tobytes())
+            header = _recv_exact(sock, FRAME_HEADER.size)
+        except (ConnectionResetError, ConnectionAbortedError, BrokenPipeError):
+            return False  # legacy service rejected the header and hung up mid-send
+        if len(header) != FRAME_HEADER.size:
+            return False
+        magic, kind, out_w, out_h = FRAME_HEADER.unpack(header)
+        if magic != FRAME_MAGIC or kind != FRAME_RAW_RGBA or (out_w, out_h) != (w, h):
+            return None
+        data = _recv_exact(sock, w * h * 4)
+        if len(data) != w * h * 4:
+            return None
+        return Image.frombuffer("RGBA", (w, h), data, "raw", "RGBA", 0, 1)
+    finally:
+        sock.close()
+
 
 def remove_background_via_service(pil_image, port=REMBG_SERVICE_PORT):
     """
     Send image to the rembg service and return RGBA PIL Image, or None if service
-    unavailable / error.
+    unavailable / error. Sends raw pixels; falls back to a length-prefixed lossless image for a service that predates that.
     """
     if pil_image is None:
         return None
     img = pil_image.convert("RGB") if pil_image.mode != "RGB" else pil_image
-    out = io.BytesIO()
-    img.save(out, "PNG")
-    png_bytes = out.getvalue()
+    if img.width * img.height <= FRAME_MAX_PIXELS:
+        try:
+            rgba = _remove_background_raw(img, port)
+        except (socket.error, OSError, ValueError):
+            return None
+        if rgba is not False:
+            return rgba
+    img_bytes = encode_lossless(img)
     try:
         sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         sock.settimeout(SOCKET_TIMEOUT)
         sock.connect((REMBG_SERVICE_HOST, port))
-        sock.send(len(png_bytes).to_bytes(4, "big"))
-        sock.send(png_bytes)
-        len_buf = b""
-        while len(len_buf) < 4:
-            chunk = sock.recv(4 - len(len_buf))
-            if not chunk:
-                sock.close()
-                return None
-            len_buf += chunk
+        # sendall: a plain send() may write only part of a large image
+        sock.sendall(len(img_bytes).to_bytes(4, "big"))
+        sock.sendall(img_bytes)
+        len_buf = _recv_exact(sock, 4)
+        if len(len_buf) != 4:
+            sock.close()
+            return None
         length = int.from_bytes(len_buf, "big")
         if length <= 0 or length > 50 * 1024 * 1024:
             sock.close()
             return None
-        data = b""
-        while len(data) < length:
-            chunk = sock.recv(min(65536, length - len(data)))
-            if not chunk:
-                break
-            data += chunk
+        data = _recv_exact(sock, length)
         sock.close()
         if len(data) != length:
             return None
@@ -8,6 +8,8 @@ import io
 import os
 import socket
 import sys
+import threading
+import time
 from concurrent.futures import ThreadPoolExecutor
 
 # Use app-local model dir only (must be set before any rembg import)
@@ -16,52 +18,116 @@ os.environ["U2NET_HOME"] = str(get_rembg_model_dir())
 
 from PIL import Image
 
+from core.rembg_client import (
+    FRAME_HEADER,
+    FRAME_MAGIC,
+    FRAME_MAX_PIXELS,
+    FRAME_RAW_RGB,
+    FRAME_RAW_RGBA,
+    _recv_exact,
+    encode_lossless,
+)
+
 
 REMBG_SERVICE_PORT = 38472
 REMBG_SERVICE_HOST = "127.0.0.1"
+# Connections handled at once: socket reads, decode and encode overlap, inference itself is serialized
+SERVICE_WORKERS = 4
+
+# Unload the models after this long without a request (0 = keep them loaded); checked every minute
+IDLE_UNLOAD_SECS = float(os.environ.get("PASSPORT_REMBG_IDLE_SECS", 300))
+_IDLE_CHECK_INTERVAL = 60.0
+
+# One removal at a time: each pass already fans out over three ORT sessions and all cores,
+# so concurrent requests would only oversubscribe the CPU
+_inference_lock = threading.Lock()
+
+
+class _BufferReader(io.RawIOBase):
+    """Seekable read-only file over a bytes-like object, without the full copy io.BytesIO makes of a bytearray."""
+
+    def __init__(self, data):
+        self._view = memoryview(data)
+        self._pos = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
 
+    def tell(self):
+        return self._pos
 
-def _read_exact(sock, n):
-    buf = b""
-    while len(buf) < n:
-        chunk = sock.recv(n - len(buf))
-        if not chunk:
-            break
-        buf += chunk
-    return buf
+    def seek(self, offset, whence=io.SEEK_SET):
+        base = (0, self._pos, len(self._view))[whence]
+        self._pos = max(0, base + offset)
+        return self._pos
+
+    def readinto(self, b):
+        chunk = self._view[self._pos:self._pos + len(b)]
+        n = len(chunk)
+        b[:n] = chunk
+        self._pos += n
+        return n
+
+
+def _remove_background(img, processor):
+    """Triple-model pipeline (same as main app), the three models running concurrently. RGBA or None."""
+    with _inference_lock:
+        mask_a, mask_b, mask_cloth = processor.get_masks_parallel(img)
+        if mask_a is None or mask_b is None:
+            return None
+        return processor.combine_masks_and_cutout(
+            img, mask_a, mask_b, mask_cloth=mask_cloth,
+            alpha_matting=True,
+            post_process_mask=True,
+        )
+
+
+def _handle_raw_request(conn, header, processor):
+    """Raw-frame request (see core.rembg_client): RGB pixels in, RGBA pixels out; 0x0 reply on failure."""
+    rgba = None
+    try:
+        magic, kind, w, h = FRAME_HEADER.unpack(header)
+        if kind == FRAME_RAW_RGB and 0 < w * h <= FRAME_MAX_PIXELS:
+            data = _recv_exact(conn, w * h * 3)
+            if len(data) == w * h * 3:
+                rgba = _remove_background(Image.frombuffer("RGB", (w, h), data, "raw", "RGB", 0, 1), processor)
+    except Exception:
+        rgba = None
+    if rgba is None:
+        conn.sendall(FRAME_HEADER.pack(FRAME_MAGIC, FRAME_RAW_RGBA, 0, 0))
+        return
+    conn.sendall(FRAME_HEADER.pack(FRAME_MAGIC, FRAME_RAW_RGBA, rgba.width, rgba.height))
+    conn.sendall(rgba.tobytes())
 
 
 def _handle_request(conn, processor):
-    """Handle one request: read PNG image, run triple-model removal, send RGBA PNG."""
+    """Handle one request: raw frame (see _handle_raw_request) or length-prefixed image in, lossless RGBA out."""
     try:
-        len_buf = _read_exact(conn, 4)
+        len_buf = _recv_exact(conn, 4)
         if len(len_buf) != 4:
             return
+        if len_buf == FRAME_MAGIC:
+            rest = _recv_exact(conn, FRAME_HEADER.size - 4)
+            if len(rest) == FRAME_HEADER.size - 4:
+                _handle_raw_request(conn, len_buf + rest, processor)
+            return
         length = int.from_bytes(len_buf, "big")
         if length <= 0 or length > 50 * 1024 * 1024:  # 50 MB max
             return
-        data = _read_exact(conn, length)
+        data = _recv_exact(conn, length)
         if len(data) != length:
             return
-        img = Image.open(io.BytesIO(data)).convert("RGB")
-        # Triple-model pipeline (same as main app)
-        mask_a = processor.get_mask_a(img)
-        mask_b = processor.get_mask_b(img)
-        mask_cloth = processor.get_mask_cloth(img)
-        if mask_a is None or mask_b is None:
-            return
-        rgba = processor.combine_masks_and_cutout(
-            img, mask_a, mask_b, mask_cloth=mask_cloth,
-            alpha_matting=True,
-            post_process_mask=True,
-        )
+        # Decode straight from the receive buffer (Pillow would buffer a socket stream in full anyway)
+        img = Image.open(_BufferReader(data)).convert("RGB")
+        rgba = _remove_background(img, processor)
         if rgba is None:
             return
-        out = io.BytesIO()
-        rgba.save(out, "PNG")
-        out_bytes = out.getvalue()
-        conn.send(len(out_bytes).to_bytes(4, "big"))
-        conn.send(out_bytes)
+        out_bytes = encode_lossless(rgba)
+        conn.sendall(len(out_bytes).to_bytes(4, "big"))
+        conn.sendall(out_bytes)
     except Exception:
         pass
     finally:
@@ -71,6 +137,15 @@ def _handle_request(conn, processor):
             pass
 
 
+def _release_idle_sessions_loop():
+    """Daemon thread: periodically free the rembg sessions when the service has been idle."""
+    from core.processor import release_idle_sessions
+    while True:
+        time.sleep(_IDLE_CHECK_INTERVAL)
+        with _inference_lock:
+            release_idle_sessions(IDLE_UNLOAD_SECS)
+
+
 def _write_rembg_error(msg):
     """Write service error (e.g. permission) so main app can show it."""
     try:
@@ -104,9 +179,7 @@ def run_server(port=None):
     processor = ImageProcessor()
     try:
         warm = Image.new("RGB", (32, 32), (255, 255, 255))
-        processor.get_mask_a(warm)
-        processor.get_mask_b(warm)
-        processor.get_mask_cloth(warm)
+        processor.get_masks_parallel(warm)  # loads the three sessions concurrently
     except (PermissionError, OSError) as e:
         _write_rembg_error(f"Permission error: {e}. Use model folder only: {get_rembg_model_dir()}")
         try:
@@ -121,7 +194,9 @@ def run_server(port=None):
         except Exception:
             pass
         raise
-    executor = ThreadPoolExecutor(max_workers=2)
+    if IDLE_UNLOAD_SECS > 0:
+        threading.Thread(target=_release_idle_sessions_loop, daemon=True).start()
+    executor = ThreadPoolExecutor(max_workers=SERVICE_WORKERS)
     try:
         while True:
             conn, _ = sock.accept()
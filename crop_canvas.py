@@ -34,6 +34,7 @@ class CropCanvas(tk.Canvas):
         self._overlay_ids = []
         self._rect_id = None
         self._handle_ids = []
+        self._redraw_pending = False  # an after_idle selection redraw is queued
         self._ratio = None  # (w, h) or None for free
         self._drag = None  # "move" | "resize_nw" | "resize_n" | ...
         self._start_xy = None
@@ -63,9 +64,16 @@ class CropCanvas(tk.Canvas):
         self._offset_x = (cw - self._display_w) // 2
         self._offset_y = (ch - self._display_h) // 2
         disp = pil_image.resize((self._display_w, self._display_h), Image.Resampling.LANCZOS)
-        self._photo = ImageTk.PhotoImage(disp)
-        self._clear_image()
-        self._image_id = self.create_image(self._offset_x, self._offset_y, image=self._photo, anchor="nw")
+        if self._photo is not None and (self._photo.width(), self._photo.height()) == disp.size:
+            self._photo.paste(disp)  # same display size: write into the existing Tk image
+        else:
+            self._photo = ImageTk.PhotoImage(disp)
+        self._delete_selection()
+        if self._image_id is None:
+            self._image_id = self.create_image(self._offset_x, self._offset_y, image=self._photo, anchor="nw")
+        else:
+            self.itemconfigure(self._image_id, image=self._photo)
+            self.coords(self._image_id, self._offset_x, self._offset_y)
         self.lower(self._image_id)
         self._rect = [
             self._offset_x, self._offset_y,
@@ -121,39 +129,53 @@ class CropCanvas(tk.Canvas):
         y2 = max(y1 + 1, min(y2, self._offset_y + self._display_h))
         self._rect = [x1, y1, x2, y2]
 
-    def _redraw_selection(self):
-        self._delete_selection()
+    def _handle_points(self):
+        """Handles at corners and mid-edges of the selection: (x, y, name)."""
         x1, y1, x2, y2 = self._rect
-        cw = int(self.cget("width"))
-        ch = int(self.cget("height"))
-        # Dark overlay outside selection (4 rectangles)
-        self._overlay_ids.append(self.create_rectangle(0, 0, cw, y1, fill=OVERLAY_COLOR, outline=""))
-        self._overlay_ids.append(self.create_rectangle(0, y2, cw, ch, fill=OVERLAY_COLOR, outline=""))
-        self._overlay_ids.append(self.create_rectangle(0, y1, x1, y2, fill=OVERLAY_COLOR, outline=""))
-        self._overlay_ids.append(self.create_rectangle(x2, y1, cw, y2, fill=OVERLAY_COLOR, outline=""))
-        self._rect_id = self.create_rectangle(x1, y1, x2, y2, outline=BORDER_COLOR, width=BORDER_WIDTH)
-        # Handles at corners and mid-edges
-        handles = [
+        return [
             (x1, y1, "nw"), ((x1 + x2) // 2, y1, "n"), (x2, y1, "ne"),
             (x2, (y1 + y2) // 2, "e"), (x2, y2, "se"), ((x1 + x2) // 2, y2, "s"),
             (x1, y2, "sw"), (x1, (y1 + y2) // 2, "w"),
         ]
-        for hx, hy, _ in handles:
-            r = HANDLE_R
-            self._handle_ids.append(
-                self.create_oval(hx - r, hy - r, hx + r, hy + r, fill=HANDLE_COLOR, outline=HANDLE_OUTLINE, width=2)
-            )
-        if self._image_id:
-            self.tag_lower(self._image_id)
 
-    def _hit_handle(self, x, y):
+    def _schedule_redraw(self):
+        """Coalesce drag redraws: at most one per pass of the event loop, however fast <B1-Motion> fires."""
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.after_idle(self._do_redraw)
+
+    def _do_redraw(self):
+        self._redraw_pending = False
+        self._redraw_selection()
+
+    def _redraw_selection(self):
         x1, y1, x2, y2 = self._rect
-        handles = [
-            (x1, y1, "nw"), ((x1 + x2) // 2, y1, "n"), (x2, y1, "ne"),
-            (x2, (y1 + y2) // 2, "e"), (x2, y2, "se"), ((x1 + x2) // 2, y2, "s"),
-            (x1, y2, "sw"), (x1, (y1 + y2) // 2, "w"),
-        ]
-        for hx, hy, name in handles:
+        cw = int(self.cget("width"))
+        ch = int(self.cget("height"))
+        # Dark overlay outside selection (4 rectangles), border, handles
+        overlay = [(0, 0, cw, y1), (0, y2, cw, ch), (0, y1, x1, y2), (x2, y1, cw, y2)]
+        r = HANDLE_R
+        handles = [(hx - r, hy - r, hx + r, hy + r) for hx, hy, _ in self._handle_points()]
+        if self._rect_id is None:
+            # First draw: create the items once; later redraws only move them
+            for box in overlay:
+                self._overlay_ids.append(self.create_rectangle(*box, fill=OVERLAY_COLOR, outline=""))
+            self._rect_id = self.create_rectangle(x1, y1, x2, y2, outline=BORDER_COLOR, width=BORDER_WIDTH)
+            for box in handles:
+                self._handle_ids.append(
+                    self.create_oval(*box, fill=HANDLE_COLOR, outline=HANDLE_OUTLINE, width=2)
+                )
+            if self._image_id:
+                self.tag_lower(self._image_id)
+            return
+        for item, box in zip(self._overlay_ids, overlay):
+            self.coords(item, *box)
+        self.coords(self._rect_id, x1, y1, x2, y2)
+        for item, box in zip(self._handle_ids, handles):
+            self.coords(item, *box)
+
+    def _hit_handle(self, x, y):
+        for hx, hy, name in self._handle_points():
             if (x - hx) ** 2 + (y - hy) ** 2 <= (HANDLE_R + 4) ** 2:
                 return name
         return None
@@ -213,7 +235,7 @@ class CropCanvas(tk.Canvas):
                 self._constrain_rect_to_ratio()
             else:
                 self._clamp_rect_to_image()
-        self._redraw_selection()
+        self._schedule_redraw()
 
     def _on_release(self, event):
         if self._drag == "new":
@@ -1,7 +1,6 @@
 """
 Photoshop-style inline HSV color picker: vertical Hue strip + Saturation/Value 2D area.
 """
-import colorsys
 import re
 import tkinter as tk
 import numpy as np
@@ -22,32 +21,91 @@ def rgb_to_hex(r, g, b):
 
 
 def rgb_to_hsv(r, g, b):
-    h, s, v = colorsys.rgb_to_hsv(r, g, b)
-    return (h * 360, s * 100, v * 100)
+    """r, g, b in 0–1 -> (h 0–360, s 0–100, v 0–100). Same arithmetic as colorsys, inlined."""
+    maxc = max(r, g, b)
+    minc = min(r, g, b)
+    if minc == maxc:
+        return (0.0, 0.0, maxc * 100)
+    rangec = maxc - minc
+    rc = (maxc - r) / rangec
+    gc = (maxc - g) / rangec
+    bc = (maxc - b) / rangec
+    if r == maxc:
+        h = bc - gc
+    elif g == maxc:
+        h = 2.0 + rc - bc
+    else:
+        h = 4.0 + gc - rc
+    return (((h / 6.0) % 1.0) * 360, (rangec / maxc) * 100, maxc * 100)
 
 
 def hsv_to_rgb(h, s, v):
-    r, g, b = colorsys.hsv_to_rgb(h / 360.0, s / 100.0, v / 100.0)
-    return (r, g, b)
+    """(h 0–360, s 0–100, v 0–100) -> r, g, b in 0–1."""
+    s /= 100.0
+    v /= 100.0
+    if s == 0.0:
+        return (v, v, v)
+    h6 = h / 360.0 * 6.0
+    i = int(h6)
+    f = h6 - i
+    p = v * (1.0 - s)
+    q = v * (1.0 - s * f)
+    t = v * (1.0 - s * (1.0 - f))
+    return ((v, t, p), (q, v, p), (p, v, t), (p, q, v), (t, p, v), (v, p, q))[i % 6]
+
+
+def _hue_strip_array(w, h):
+    """(h, w, 3) uint8 rainbow, top=0° to bottom=360°, at full S and V; same values as hsv_to_rgb per row."""
+    hue = 360 * (1 - np.arange(h) / h) / 360.0  # same rounding as hsv_to_rgb(360 * (1 - i / h), ...)
+    h6 = hue * 6.0
+    i = h6.astype(np.int64)
+    f = h6 - i
+    one, zero = np.ones(h), np.zeros(h)
+    q, t = 1.0 - f, 1.0 - (1.0 - f)  # colorsys' q and t at s=v=1, same float ops (p is 0)
+    # colorsys.hsv_to_rgb's six sectors, picked per row
+    rgb = np.stack([
+        np.choose(i % 6, [one, q, zero, zero, t, one]),
+        np.choose(i % 6, [t, one, one, q, zero, zero]),
+        np.choose(i % 6, [zero, zero, t, one, one, q]),
+    ], axis=-1)
+    rows = (rgb * 255).astype(np.uint8)  # truncates like int(r * 255)
+    return np.ascontiguousarray(np.broadcast_to(rows[:, None, :], (h, w, 3)))
 
 
 class HSVPicker(ctk.CTkFrame):
     """
     Two-part picker: vertical Hue strip (right) + Saturation/Value square (left).
-    Callback on_change(hex_str) when user picks a color. set_hex(hex_str) to set from outside.
+    Callback on_change(hex_str) when user picks a color (every drag step); on_release(hex_str) when
+    the mouse button is released on either part. set_hex(hex_str) to set from outside.
     """
 
     HUE_STRIP_WIDTH = 24
     SV_BOX_SIZE = (180, 220)
+    # (w, h) -> hue strip PIL image; constant, so shared by every picker (PhotoImages stay per widget)
+    _hue_strip_cache = {}
 
-    def __init__(self, parent, initial_hex="#FFFFFF", on_change=None, **kwargs):
+    def __init__(self, parent, initial_hex="#FFFFFF", on_change=None, on_release=None, **kwargs):
         super().__init__(parent, fg_color="transparent", **kwargs)
         self.on_change = on_change
+        self.on_release = on_release
         self._h, self._s, self._v = rgb_to_hsv(*hex_to_rgb(initial_hex))
         self._sv_dragging = False
         self._hue_dragging = False
         self._sv_photo = None
         self._hue_photo = None
+        self._sv_redraw_pending = False  # an after_idle SV box rebuild is queued
+        self._last_drawn_h = None  # hue the SV box was last painted for
+        self._sv_thumb_ids = None  # (white ring, black ring) ovals, created on first draw then moved
+        self._hue_thumb_id = None
+        # At a fixed hue each SV box channel is V*(1-S) + V*S*c, c being the pure hue's channel value,
+        # so only these two (h, w, 1) layers are needed; scaled by 255 up front
+        w, h = self.SV_BOX_SIZE
+        sat = (np.arange(w) / w)[None, :, None]
+        val = (1 - np.arange(h) / h)[:, None, None]
+        self._sv_white = ((1 - sat) * val * 255).astype(np.float32)
+        self._sv_sat = (sat * val * 255).astype(np.float32)
+        self._sv_buf = np.empty((h, w, 3), np.float32)  # reused per redraw, with its uint8 copy
+        self._sv_rgb = np.empty((h, w, 3), np.uint8)
 
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(0, weight=1)
@@ -76,6 +134,7 @@ class HSVPicker(ctk.CTkFrame):
         self.hue_canvas.pack(fill="both", expand=True)
         self.hue_canvas.bind("<Button-1>", self._on_hue_press)
         self.hue_canvas.bind("<B1-Motion>", self._on_hue_drag)
+        self.hue_canvas.bind("<ButtonRelease-1>", self._on_hue_release)
 
         self._draw_hue_strip()
         self._draw_sv_box()
@@ -84,60 +143,68 @@ class HSVPicker(ctk.CTkFrame):
 
     def _draw_hue_strip(self):
         """Vertical rainbow gradient 0–360°."""
-        w, h = self.HUE_STRIP_WIDTH, self.SV_BOX_SIZE[1]
-        arr = np.zeros((h, w, 3), dtype=np.uint8)
-        for i in range(h):
-            hue = 360 * (1 - i / h)  # top=0, bottom=360
-            r, g, b = hsv_to_rgb(hue, 100, 100)
-            arr[i, :] = [int(r * 255), int(g * 255), int(b * 255)]
-        img = Image.fromarray(arr, mode="RGB")
+        key = (self.HUE_STRIP_WIDTH, self.SV_BOX_SIZE[1])
+        img = HSVPicker._hue_strip_cache.get(key)
+        if img is None:
+            img = HSVPicker._hue_strip_cache[key] = Image.fromarray(_hue_strip_array(*key))
         self._hue_photo = ImageTk.PhotoImage(img)
         self.hue_canvas.delete("all")
         self.hue_canvas.create_image(0, 0, anchor="nw", image=self._hue_photo)
 
     def _draw_sv_box(self):
         """2D gradient: current H, S horizontal (0–100), V vertical (100–0)."""
-        w, h = self.SV_BOX_SIZE[0], self.SV_BOX_SIZE[1]
-        H = self._h
-        arr = []
-        for py in range(h):
-            v = 100 * (1 - py / h)
-            row = []
-            for px in range(w):
-                s = 100 * (px / w)
-                r, g, b = hsv_to_rgb(H, s, v)
-                row.append([int(r * 255), int(g * 255), int(b * 255)])
-            arr.append(row)
-        img = Image.fromarray(np.uint8(arr), mode="RGB")
-        self._sv_photo = ImageTk.PhotoImage(img)
-        self.sv_canvas.delete("sv_grad")
-        self.sv_canvas.create_image(0, 0, anchor="nw", image=self._sv_photo, tags="sv_grad")
+        self._last_drawn_h = self._h
+        hue_rgb = np.array(hsv_to_rgb(self._h, 100, 100), dtype=np.float32)
+        buf = self._sv_buf
+        np.multiply(self._sv_sat, hue_rgb, out=buf)
+        buf += self._sv_white
+        np.copyto(self._sv_rgb, buf, casting="unsafe")  # truncates like astype(np.uint8)
+        img = Image.frombuffer("RGB", self.SV_BOX_SIZE, self._sv_rgb, "raw", "RGB", 0, 1)
+        if self._sv_photo is None:
+            self._sv_photo = ImageTk.PhotoImage(img)
+            self.sv_canvas.create_image(0, 0, anchor="nw", image=self._sv_photo, tags="sv_grad")
+        else:
+            self._sv_photo.paste(img)  # same size: update in place, item stays under the thumb
 
     def _draw_hue_thumb(self):
         """Small indicator on hue strip."""
-        self.hue_canvas.delete("thumb")
         h = self.SV_BOX_SIZE[1]
         y = h * (1 - self._h / 360)
         y = max(2, min(h - 2, y))
-        self.hue_canvas.create_rectangle(0, y - 2, self.HUE_STRIP_WIDTH, y + 2, outline="white", width=2, fill="black", tags="thumb")
+        if self._hue_thumb_id is None:
+            self._hue_thumb_id = self.hue_canvas.create_rectangle(
+                0, y - 2, self.HUE_STRIP_WIDTH, y + 2, outline="white", width=2, fill="black", tags="thumb"
+            )
+        else:
+            self.hue_canvas.coords(self._hue_thumb_id, 0, y - 2, self.HUE_STRIP_WIDTH, y + 2)
 
     def _draw_sv_thumb(self):
         """Circle/dot on SV box at current S, V."""
-        self.sv_canvas.delete("sv_thumb")
         w, h = self.SV_BOX_SIZE[0], self.SV_BOX_SIZE[1]
         x = w * (self._s / 100)
         y = h * (1 - self._v / 100)
         x = max(2, min(w - 2, x))
         y = max(2, min(h - 2, y))
         r = 5
-        self.sv_canvas.create_oval(x - r, y - r, x + r, y + r, outline="white", width=2, tags="sv_thumb")
-        self.sv_canvas.create_oval(x - r + 1, y - r + 1, x + r - 1, y + r - 1, outline="black", width=1, tags="sv_thumb")
+        if self._sv_thumb_ids is None:
+            self._sv_thumb_ids = (
+                self.sv_canvas.create_oval(x - r, y - r, x + r, y + r, outline="white", width=2, tags="sv_thumb"),
+                self.sv_canvas.create_oval(x - r + 1, y - r + 1, x + r - 1, y + r - 1, outline="black", width=1, tags="sv_thumb"),
+            )
+        else:
+            outer, inner = self._sv_thumb_ids
+            self.sv_canvas.coords(outer, x - r, y - r, x + r, y + r)
+            self.sv_canvas.coords(inner, x - r + 1, y - r + 1, x + r - 1, y + r - 1)
 
     def _emit(self):
         hex_c = rgb_to_hex(*hsv_to_rgb(self._h, self._s, self._v))
         if self.on_change:
             self.on_change(hex_c)
 
+    def _emit_release(self):
+        if self.on_release:
+            self.on_release(rgb_to_hex(*hsv_to_rgb(self._h, self._s, self._v)))
+
     def _on_hue_press(self, event):
         self._hue_dragging = True
         self._set_hue_from_y(event.y)
@@ -146,14 +213,29 @@ class HSVPicker(ctk.CTkFrame):
         if self._hue_dragging:
             self._set_hue_from_y(event.y)
 
+    def _on_hue_release(self, event):
+        self._hue_dragging = False
+        self._emit_release()
+
     def _set_hue_from_y(self, y):
         h = self.SV_BOX_SIZE[1]
         self._h = 360 * (1 - max(0, min(1, y / h)))
         self._draw_hue_thumb()
-        self._draw_sv_box()
-        self._draw_sv_thumb()
+        # Sub-pixel jitter: a hue change under 0.5° is invisible in the box, skip the rebuild
+        if self._last_drawn_h is None or round(self._h * 2) != round(self._last_drawn_h * 2):
+            self._schedule_sv_redraw()
         self._emit()
 
+    def _schedule_sv_redraw(self):
+        """Rebuild the SV box at most once per event-loop pass, for whatever hue is current by then."""
+        if not self._sv_redraw_pending:
+            self._sv_redraw_pending = True
+            self.after_idle(self._flush_sv_redraw)
+
+    def _flush_sv_redraw(self):
+        self._sv_redraw_pending = False
+        self._draw_sv_box()
+
     def _on_sv_press(self, event):
         self._sv_dragging = True
         self._set_sv_from_xy(event.x, event.y)
@@ -164,6 +246,7 @@ class HSVPicker(ctk.CTkFrame):
 
     def _on_sv_release(self, event):
         self._sv_dragging = False
+        self._emit_release()
 
     def _set_sv_from_xy(self, x, y):
         w, h = self.SV_BOX_SIZE[0], self.SV_BOX_SIZE[1]
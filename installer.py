@@ -3,12 +3,16 @@ First-run installer: download rembg models and register "Open with PassportAI" f
 Runs when the app starts for the first time (no marker file). Asks user confirmation;
 may require administrator permission for system-wide "Open with" (we use per-user where possible).
 """
+import logging
 import os
 import platform
 import subprocess
 import sys
+import threading
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
 # Image extensions we register for "Open with"
 IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".webp", ".bmp")
 MIME_TYPES_IMAGES = ("image/jpeg", "image/png", "image/webp", "image/bmp")
@@ -74,18 +78,37 @@ def _get_executable_command(executable_path_arg=None):
 
 
 def _download_models():
-    """Trigger download of all rembg models by creating sessions and running a tiny predict."""
+    """
+    Download all rembg models. Uses each session class's download_models() so no ONNX Runtime
+    session is built; older rembg without it falls back to creating a session and a tiny predict.
+    """
     try:
+        from concurrent.futures import ThreadPoolExecutor
         from rembg import new_session
         from PIL import Image
-        # Tiny 2x2 image to trigger model load/download
+        # Tiny 2x2 image to trigger model load/download (fallback path only)
         img = Image.new("RGB", (2, 2), (128, 128, 128))
-        for name in ("u2net_human_seg", "u2net", "u2net_cloth_seg"):
+
+        def load_one(name):
+            try:
+                from rembg.sessions import sessions_class
+                session_class = next(sc for sc in sessions_class if sc.name() == name)
+                session_class.download_models()
+                return
+            except (ImportError, AttributeError, StopIteration, TypeError):
+                pass  # rembg version without per-class downloads
+            except Exception:
+                return  # download failed; the service retries on first use
             try:
                 session = new_session(name)
                 session.predict(img)
             except Exception:
                 pass
+
+        # Independent downloads: fetch all three at once
+        names = ("u2net_human_seg", "u2net", "u2net_cloth_seg")
+        with ThreadPoolExecutor(max_workers=len(names)) as ex:
+            list(ex.map(load_one, names))
     except Exception as e:
         raise RuntimeError(f"Model download failed: {e}") from e
 
@@ -99,28 +122,18 @@ def _register_open_with_windows(command_for_open_with):
     # HKCU\Software\Classes\Applications\PassportPhotoCreator\shell\open\command
     app_name = "PassportPhotoCreator"
     try:
-        key = winreg.CreateKeyEx(
-            winreg.HKEY_CURRENT_USER,
-            f"Software\\Classes\\Applications\\{app_name}\\shell\\open\\command",
-            0,
-            winreg.KEY_SET_VALUE,
-        )
-        winreg.SetValue(key, "", winreg.REG_SZ, command_for_open_with)
-        key.Close()
-        # Add to OpenWithList for each extension
-        for ext in IMAGE_EXTENSIONS:
-            ext_key_name = f"Software\\Classes\\{ext}\\OpenWithList\\{app_name}"
-            try:
-                ek = winreg.CreateKeyEx(
-                    winreg.HKEY_CURRENT_USER,
-                    ext_key_name,
-                    0,
-                    winreg.KEY_SET_VALUE,
-                )
-                winreg.SetValue(ek, "", winreg.REG_SZ, "")
-                ek.Close()
-            except Exception:
-                pass
+        # Open HKCU\Software\Classes once; every key below is created relative to it
+        with winreg.CreateKeyEx(winreg.HKEY_CURRENT_USER, "Software\\Classes", 0, winreg.KEY_WRITE) as classes:
+            with winreg.CreateKeyEx(
+                classes, f"Applications\\{app_name}\\shell\\open\\command", 0, winreg.KEY_SET_VALUE
+            ) as key:
+                winreg.SetValueEx(key, "", 0, winreg.REG_SZ, command_for_open_with)
+            # Add to OpenWithList for each extension (the subkey's existence is the registration)
+            for ext in IMAGE_EXTENSIONS:
+                try:
+                    winreg.CreateKeyEx(classes, f"{ext}\\OpenWithList\\{app_name}", 0, winreg.KEY_SET_VALUE).Close()
+                except Exception:
+                    pass
         return True
     except Exception:
         return False
@@ -139,6 +152,54 @@ def _register_open_with_darwin(executable_path):
     return True
 
 
+def _set_linux_default_apps(desktop_name, mime_types):
+    """
+    Make desktop_name the default for mime_types in the user's mimeapps.list, in one write
+    (what `xdg-mime default` does, without a subprocess per type). Edits line by line: only the given
+    keys under [Default Applications] are set or added; comments, duplicates and all other lines are kept.
+    """
+    config_home = os.environ.get("XDG_CONFIG_HOME") or os.path.expanduser("~/.config")
+    path = Path(config_home) / "mimeapps.list"
+    lines = path.read_text(encoding="utf-8").splitlines() if path.exists() else []
+    entry = {mime: f"{mime}={desktop_name}" for mime in mime_types}
+    out = []
+    missing = list(mime_types)
+    in_defaults = False
+    in_first_defaults = False  # new keys go at the end of the first [Default Applications] section
+    insert_at = None
+    for line in lines:
+        stripped = line.strip()
+        if stripped.startswith("[") and stripped.endswith("]"):
+            in_defaults = stripped == "[Default Applications]"
+            in_first_defaults = in_defaults and insert_at is None
+        elif in_defaults and "=" in stripped and not stripped.startswith("#"):
+            key = stripped.split("=", 1)[0].strip()
+            if key in entry:
+                line = entry[key]
+                if key in missing:
+                    missing.remove(key)
+        out.append(line)
+        if in_first_defaults and stripped:
+            insert_at = len(out)  # after the header / last non-blank line, before trailing blanks
+    if missing:
+        new_lines = [entry[mime] for mime in missing]
+        if insert_at is None:
+            if out and out[-1].strip():
+                out.append("")
+            out.append("[Default Applications]")
+            out.extend(new_lines)
+        else:
+            out[insert_at:insert_at] = new_lines
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        tmp.write_text("\n".join(out) + "\n", encoding="utf-8")
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
 def _register_open_with_linux(executable_path, command_for_open_with):
     """Linux: install .desktop and set xdg-mime default for images (user-level)."""
     desktop_dir = Path.home() / ".local" / "share" / "applications"
@@ -163,16 +224,20 @@ Terminal=false
     try:
         desktop_path.write_text(content, encoding="utf-8")
         # Set as default for common image types (user-level)
-        for mime in ("image/jpeg", "image/png", "image/webp", "image/bmp"):
-            try:
-                subprocess.run(
-                    ["xdg-mime", "default", "passport-photo-creator.desktop", mime],
-                    capture_output=True,
-                    timeout=5,
-                    cwd=str(desktop_dir),
-                )
-            except Exception:
-                pass
+        try:
+            _set_linux_default_apps(desktop_path.name, MIME_TYPES_IMAGES)
+        except Exception:
+            logger.warning("Could not update mimeapps.list; falling back to xdg-mime", exc_info=True)
+            for mime in MIME_TYPES_IMAGES:
+                try:
+                    subprocess.run(
+                        ["xdg-mime", "default", desktop_path.name, mime],
+                        capture_output=True,
+                        timeout=5,
+                        cwd=str(desktop_dir),
+                    )
+                except Exception:
+                    pass
         return True
     except Exception:
         return False
@@ -200,11 +265,13 @@ def run_first_run_installer(executable_path_arg=None):
     app_dir.mkdir(parents=True, exist_ok=True)
     marker = _get_install_marker_path()
 
-    # 1. Download models
-    _download_models()
+    # 1. Register Open with (quick registry/desktop-file writes) alongside the model download
+    register = threading.Thread(target=register_open_with, args=(executable_path_arg,), daemon=True)
+    register.start()
 
-    # 2. Register Open with
-    register_open_with(executable_path_arg)
+    # 2. Download models
+    _download_models()
+    register.join(timeout=30)
 
     # 3. Mark as installed
     try:
@@ -2,11 +2,10 @@
 Launcher: show splash with logo, log window, and loading while setting up the app.
 Entry point for best startup UX. Use this for PyInstaller; "python main.py" redirects here too.
 """
+import logging
 import os
-import queue
 import sys
 import threading
-import time
 from pathlib import Path
 
 
@@ -15,6 +14,21 @@ import tkinter as tk
 from tkinter import scrolledtext
 
 
+class _SplashLogHandler(logging.Handler):
+    """Hands each formatted record to the splash's Tk thread via after(); safe to emit from the loader thread."""
+
+    def __init__(self, splash, insert):
+        super().__init__()
+        self._splash = splash
+        self._insert = insert
+
+    def emit(self, record):
+        try:
+            self._splash.after(0, self._insert, self.format(record))
+        except (RuntimeError, tk.TclError):
+            pass  # splash already closed
+
+
 def _run_installer_if_frozen():
     """First-run installer check (frozen app only). Returns False if user cancelled install."""
     if not getattr(sys, "frozen", False):
@@ -66,10 +80,9 @@ def _show_splash_and_launch():
         fg="#94a3b8", bg=bg,
     ).pack(pady=(0, 12))
 
-    # Log area (thread-safe: background thread puts lines in queue; flush runs on main thread)
+    # Log area (background thread logs to "passportai.splash"; the handler hands lines to the Tk thread)
     log_frame = tk.Frame(splash, bg=bg)
     log_frame.pack(fill=tk.BOTH, expand=True, padx=16, pady=(0, 16))
-    log_queue = queue.Queue()
     log_text = scrolledtext.ScrolledText(
         log_frame,
         height=14,
@@ -84,72 +97,70 @@ def _show_splash_and_launch():
     log_text.pack(fill=tk.BOTH, expand=True)
     log_text.configure(state=tk.DISABLED)
 
-    def append_log(msg):
-        log_queue.put(msg)
+    def insert_log(msg):
+        log_text.configure(state=tk.NORMAL)
+        log_text.insert(tk.END, msg + "\n")
+        log_text.see(tk.END)
+        log_text.configure(state=tk.DISABLED)
 
-    def flush_log():
-        try:
-            while True:
-                msg = log_queue.get_nowait()
-                if not splash.winfo_exists():
-                    return
-                log_text.configure(state=tk.NORMAL)
-                log_text.insert(tk.END, msg + "\n")
-                log_text.see(tk.END)
-                log_text.configure(state=tk.DISABLED)
-        except queue.Empty:
-            pass
-        if splash.winfo_exists() and not state["done"]:
-            splash.after(50, flush_log)
-
-    splash.after(100, flush_log)
+    log = logging.getLogger("passportai.splash")
+    log.setLevel(logging.INFO)
+    log.propagate = False  # splash-only; main's console logging is configured separately
+    handler = _SplashLogHandler(splash, insert_log)
+    log.addHandler(handler)
 
     # Loading state: (done, initial_file)
     state = {"done": False, "initial_file": None}
 
     def load_in_background():
         try:
-            append_log("Starting PassportAI…")
+            log.info("Starting PassportAI…")
             # Use app-local model dir only (no ~/.u2net); set before any rembg load
             try:
                 from installer import ensure_rembg_model_dir, get_rembg_model_dir
                 ensure_rembg_model_dir()
-                append_log("Model folder: " + str(get_rembg_model_dir()))
+                log.info("Model folder: " + str(get_rembg_model_dir()))
             except (PermissionError, OSError) as e:
                 from installer import get_rembg_model_dir
                 os.environ["U2NET_HOME"] = str(get_rembg_model_dir())
-                append_log("Permission error: " + str(e))
-                append_log("Using model folder only: " + str(get_rembg_model_dir()))
-            append_log("Loading main module…")
+                log.info("Permission error: " + str(e))
+                log.info("Using model folder only: " + str(get_rembg_model_dir()))
+            log.info("Loading main module…")
             import main  # Heavy imports (ctk, PIL, etc.) run here
             state["initial_file"] = main._get_initial_file_from_args()
-            append_log("Main module loaded.")
+            log.info("Main module loaded.")
             # Only check model file existence; models load in the background service
-            append_log("Checking background removal models…")
+            log.info("Checking background removal models…")
             try:
                 from installer import get_rembg_model_dir
                 model_dir = get_rembg_model_dir()
                 if model_dir.is_dir():
                     onnx = list(model_dir.glob("*.onnx"))
                     if onnx:
-                        append_log(f"  Models found: {len(onnx)} file(s)")
+                        log.info(f"  Models found: {len(onnx)} file(s)")
                     else:
-                        append_log("  No model files yet (service will download on first use).")
+                        log.info("  No model files yet (service will download on first use).")
                 else:
-                    append_log("  No model cache yet (service will download on first use).")
+                    log.info("  No model cache yet (service will download on first use).")
             except Exception as e:
-                append_log(f"  Note: {e}")
-            append_log("Ready.")
+                log.info(f"  Note: {e}")
+            log.info("Ready.")
         except Exception as e:
-            append_log(f"Error: {e}")
+            log.info(f"Error: {e}")
         state["done"] = True
-
-    threading.Thread(target=load_in_background, daemon=True).start()
-
-    # Poll until loading is done
-    while not state["done"]:
-        splash.update()
-        time.sleep(0.05)
+        try:
+            splash.after(0, splash.quit)  # queued behind the log lines above
+        except (RuntimeError, tk.TclError):
+            pass  # splash already closed
+
+    # Start once mainloop is running, so the thread's after() calls have a loop to land in
+    splash.after(0, lambda: threading.Thread(target=load_in_background, daemon=True).start())
+
+    # Run the splash event loop until the loader quits it
+    splash.mainloop()
+    log.removeHandler(handler)
+    if not state["done"]:
+        return  # splash closed by the user before loading finished
 
     # Loading done: destroy splash so app will be the only Tk root, then run app
     try:
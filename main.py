@@ -2,6 +2,8 @@
 PassportAI – Modern 3-step flow: (1) Add & crop, (2) Remove bg (optional) + color, (3) Border & export.
 CTkImage for HighDPI; drag-to-crop canvas; modern UI.
 """
+import collections
+import hashlib
 import logging
 import os
 import sys
@@ -40,7 +42,7 @@ TEMP_DIR.mkdir(parents=True, exist_ok=True)
 if "U2NET_HOME" not in os.environ:
     os.environ["U2NET_HOME"] = str(_get_app_data_dir() / "u2net")
 
-IMAGE_EXT = {".jpg", ".jpeg", ".png", ".webp", ".bmp"}
+IMAGE_EXT = frozenset({".jpg", ".jpeg", ".png", ".webp", ".bmp"})
 
 CROP_RATIOS = [
     ("Free", None),
@@ -72,7 +74,9 @@ def _get_rembg_error_message():
         pass
     return None
 MAX_PREVIEW_HEIGHT = 400
+STEP2_PREVIEW_SIZE = (540, MAX_PREVIEW_HEIGHT - 50)  # Step 2 zoom/pan canvas (w, h)
 UPSCALE_FACTOR = 2  # Enlarge after background for better quality when zooming
+CUTOUT_CACHE_SIZE = 8  # background removal results kept per crop (same crop again = no inference)
 
 # Set to True to use Gemini for suggested background color; False to use default white only
 ENABLE_GEMINI = False
@@ -110,15 +114,31 @@ class App(ctk.CTk):
         self.source_path = None
         self.original_image = None
         self.step1_cropped = None
-        self.step2_with_bg = None
+        self.step2_with_bg = None  # composited at crop resolution; upscaled only for Step 3 (see below)
+        self._step3_upscaled = None  # (step2_with_bg, its UPSCALE_FACTOR upscale), made on first Step 3 use
         self.cached_rgba = None  # no-background image for Step 2 color change
+        self.cached_rgba_preview = None  # cached_rgba fitted to the Step 2 preview, for live picker drags
         self.step2_bg_color = None  # current background hex
         self.step2_bg_source = None  # "api" | "default" | "custom"
-        self._ctk_images = []
+        self._ctk_images = collections.deque()  # (CTkImage, resized copy we own or None), newest last
         self._processing = False
+        self._exporting = False  # a PNG save is running on the pool; Export stays disabled until it finishes
         self._crop_ratio_index = 2  # default 3:4 (passport)
+        # Long-lived pool for Step 2's concurrent calls (service / Gemini); threads start on first submit
+        self._bg_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="pp-step2")
+        self._step2_prefetch = None  # (cropped image, future of _remove_background) started on entering Step 2
+        self._pending_picker_color = None  # latest picker color during a drag, applied by _flush_picker_color
+        self._pending_picker_job = None
+        self._cutout_cache = {}  # crop content key -> (rgba, bg), oldest first; see _remove_background
+        self._cutout_cache_lock = threading.Lock()
+
+        self._lazy_lock = threading.Lock()  # _get_processor/_get_ai run on worker threads too
+        self._current_step = 1
+        self._pending_previews = {}  # preview widget -> latest image sent while its step was hidden
 
         self._build_ui()
+        # Warm up Step 2/3 imports while the user is still picking and cropping
+        self.after(200, lambda: self._bg_executor.submit(self._warm_imports))
         # Start background rembg service after a short delay (stays running after app closes)
         self.after(1500, self._start_rembg_service)
 
@@ -134,18 +154,34 @@ class App(ctk.CTk):
 
     def _get_processor(self):
         """Lazy-load ImageProcessor (pulls in rembg/cv2/numpy on first use)."""
-        if self._processor is None:
-            from core.processor import ImageProcessor
-            self._processor = ImageProcessor()
+        with self._lazy_lock:
+            if self._processor is None:
+                from core.processor import ImageProcessor
+                self._processor = ImageProcessor()
         return self._processor
 
     def _get_ai(self):
         """Lazy-load AILogic (pulls in google.generativeai on first use)."""
-        if self._ai is None:
-            from core.ai_logic import AILogic
-            self._ai = AILogic()
+        with self._lazy_lock:
+            if self._ai is None:
+                from core.ai_logic import AILogic
+                self._ai = AILogic()
         return self._ai
 
+    def _warm_imports(self):
+        """
+        Import what Steps 2/3 use in this process (processor, numpy/cv2, Gemini if enabled) on a worker.
+        rembg/onnxruntime are left to the background service; they load here only if it is unavailable.
+        """
+        try:
+            self._get_processor()
+            import numpy  # noqa: F401
+            import cv2  # noqa: F401
+            if ENABLE_GEMINI:
+                self._get_ai()
+        except Exception:
+            pass
+
     def _build_ui(self):
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(1, weight=1)
@@ -245,7 +281,7 @@ class App(ctk.CTk):
         self.preview_frame_2.grid_propagate(False)
         self.preview_frame_2.grid_columnconfigure(0, weight=1)
         self.preview_frame_2.grid_rowconfigure(0, weight=1)
-        self.preview_zoom_2 = ZoomPanImage(self.preview_frame_2, width=540, height=MAX_PREVIEW_HEIGHT - 50, placeholder_text="Cropped image will appear here")
+        self.preview_zoom_2 = ZoomPanImage(self.preview_frame_2, width=STEP2_PREVIEW_SIZE[0], height=STEP2_PREVIEW_SIZE[1], placeholder_text="Cropped image will appear here")
         self.preview_zoom_2.grid(row=0, column=0, sticky="nsew", padx=4, pady=4)
         # Step 2 loader overlay (rotating spinner over preview while removing background)
         self.step2_loader_overlay = ctk.CTkFrame(self.preview_frame_2, fg_color=COLORS["card"], corner_radius=12, border_width=1, border_color=COLORS["border"])
@@ -262,7 +298,10 @@ class App(ctk.CTk):
         step2_picker_frame.grid(row=0, column=1, sticky="nsew")
         step2_picker_frame.grid_propagate(False)
         ctk.CTkLabel(step2_picker_frame, text="Background color", font=ctk.CTkFont(size=13, weight="bold"), text_color=COLORS["text"]).pack(anchor="w", pady=(0, 8))
-        self.step2_hsv_picker = HSVPicker(step2_picker_frame, initial_hex="#FFFFFF", on_change=self._on_picker_color_change)
+        self.step2_hsv_picker = HSVPicker(
+            step2_picker_frame, initial_hex="#FFFFFF",
+            on_change=self._on_picker_color_change, on_release=self._on_picker_color_release,
+        )
         self.step2_hsv_picker.pack(anchor="w")
         # Selected color (below picker)
         selected_row = ctk.CTkFrame(step2_picker_frame, fg_color="transparent")
@@ -305,6 +344,7 @@ class App(ctk.CTk):
         self.preview_frame_3.grid_columnconfigure(0, weight=1)
         self.preview_frame_3.grid_rowconfigure(0, weight=1)
         self.preview_zoom_3 = ZoomPanImage(self.preview_frame_3, width=540, height=MAX_PREVIEW_HEIGHT - 50, placeholder_text="Final preview")
+        self._preview_steps = {self.preview_zoom_2: 2, self.preview_zoom_3: 3}
         self.preview_zoom_3.grid(row=0, column=0, sticky="nsew", padx=4, pady=4)
         step3_nav = ctk.CTkFrame(self.step3_frame, fg_color="transparent")
         step3_nav.grid(row=3, column=0, sticky="ew", pady=(0, 12))
@@ -336,6 +376,10 @@ class App(ctk.CTk):
         self.step2_frame.grid_remove()
         self.step3_frame.grid_remove()
         self._update_step_indicator(n)
+        self._current_step = n
+        for widget, step in self._preview_steps.items():
+            if step == n and widget in self._pending_previews:
+                widget.set_image(self._pending_previews.pop(widget))
         if n == 1:
             self.step1_frame.grid(row=0, column=0, sticky="nsew")
         elif n == 2:
@@ -356,31 +400,37 @@ class App(ctk.CTk):
         else:
             color = COLORS["status_info"]
             self._status_label.configure(text_color=color[0] if isinstance(color, tuple) else color)  # info = muted
-        self.update_idletasks()
 
     def _draw_step2_loader(self):
-        """Draw one frame of the rotating spinner on the Step 2 loader canvas."""
-        if self._step2_loader_arc_id is not None:
-            self.step2_loader_canvas.delete(self._step2_loader_arc_id)
+        """Advance the spinner one frame: rotate the arc created by _create_step2_loader_items."""
+        start = self._step2_loader_angle % 360
+        self.step2_loader_canvas.itemconfigure(self._step2_loader_arc_id, start=start)
+        self._step2_loader_angle = (self._step2_loader_angle + 8) % 360  # 8° per 33 ms frame
+
+    def _create_step2_loader_items(self):
+        """Ring + arc on the loader canvas, once per show (colors follow the current appearance mode)."""
         self.step2_loader_canvas.delete("all")
         mode = ctk.get_appearance_mode()
         border_outline = COLORS["border"][0] if mode == "Light" else COLORS["border"][1]
         r = 24
         cx, cy = 28, 28
         self.step2_loader_canvas.create_oval(cx - r, cy - r, cx + r, cy + r, outline=border_outline, width=2)
-        start = self._step2_loader_angle % 360
         self._step2_loader_arc_id = self.step2_loader_canvas.create_arc(
-            cx - r, cy - r, cx + r, cy + r, start=start, extent=270,
+            cx - r, cy - r, cx + r, cy + r, start=0, extent=270,
             outline=COLORS["accent"], width=3, style=tk.ARC
         )
-        self._step2_loader_angle = (self._step2_loader_angle + 12) % 360
 
     def _animate_step2_loader(self):
-        """Schedule next spinner frame; called every 50ms while overlay is visible."""
+        """Spinner frame (~30 fps) while processing; nothing is drawn while the window is minimized/hidden."""
         if not self._processing:
             return
-        self._draw_step2_loader()
-        self._step2_loader_job = self.after(50, self._animate_step2_loader)
+        if self.winfo_viewable() and self.state() != "iconic":
+            self._draw_step2_loader()
+        self._step2_loader_job = self.after(33, self._queue_step2_loader_frame)
+
+    def _queue_step2_loader_frame(self):
+        # Next frame only once Tk has drained pending work, so frames never pile up behind slow redraws
+        self._step2_loader_job = self.after_idle(self._animate_step2_loader)
 
     def _show_step2_loader(self):
         """Show rotating loader overlay over Step 2 preview."""
@@ -389,8 +439,9 @@ class App(ctk.CTk):
         self.step2_loader_canvas.configure(bg=canvas_bg)
         self.step2_loader_overlay.place(relx=0, rely=0, relwidth=1, relheight=1)
         self._step2_loader_angle = 0
+        self._create_step2_loader_items()
         self._draw_step2_loader()
-        self._step2_loader_job = self.after(50, self._animate_step2_loader)
+        self._step2_loader_job = self.after(33, self._queue_step2_loader_frame)
 
     def _hide_step2_loader(self):
         """Hide loader overlay and stop animation."""
@@ -409,9 +460,12 @@ class App(ctk.CTk):
             had_previous = self.step1_cropped is not None or self.step2_with_bg is not None
             self.original_image = Image.open(path).convert("RGB")
             self.source_path = path
+            self._cancel_step2_prefetch()
             self.step1_cropped = None
             self.step2_with_bg = None
+            self._step3_upscaled = None
             self.cached_rgba = None
+            self.cached_rgba_preview = None
             self.step2_bg_color = None
             self.step2_bg_source = None
             self.crop_canvas.set_ratio(CROP_RATIOS[self._crop_ratio_index][1])
@@ -430,6 +484,7 @@ class App(ctk.CTk):
             if label == choice:
                 self._crop_ratio_index = i
                 break
+        self._cancel_step2_prefetch()
         self.crop_canvas.set_ratio(CROP_RATIOS[self._crop_ratio_index][1])
         if self.original_image is not None:
             self.crop_canvas.set_image(self.original_image)
@@ -448,6 +503,7 @@ class App(ctk.CTk):
         self._show_preview_pil(self.preview_zoom_2, self.step1_cropped)
         self.btn_remove_bg.configure(state="normal")
         self.btn_step2_next.configure(state="normal")  # allow skipping bg removal
+        self._prefetch_step2()
 
     def _back_to_step2(self):
         """Back from Step 3 to Step 2."""
@@ -459,6 +515,69 @@ class App(ctk.CTk):
         self.btn_remove_bg.configure(state="normal")
         self.btn_step2_next.configure(state="normal")  # can always go to Step 3 (with or without bg removal)
 
+    def _step2_status(self, msg):
+        """Progress message from Step 2 work; shown only while the user is waiting on it (not for prefetch)."""
+        if self._processing:
+            self.after(0, lambda: self._set_status(msg, "info"))
+
+    def _remove_background(self, img):
+        """
+        Background removal (+ Gemini color if enabled) for img. Returns (rgba, bg); rgba None if it failed.
+        Results are remembered per crop content, so re-running on the same crop is instant.
+        """
+        key = (img.size, img.mode, hashlib.blake2b(img.tobytes(), digest_size=8).digest())
+        with self._cutout_cache_lock:
+            cached = self._cutout_cache.get(key)
+        if cached is not None:
+            return cached
+        rgba = None
+        bg = None
+        future_bg = None
+        if ENABLE_GEMINI:
+            future_bg = self._bg_executor.submit(self._get_ai().suggest_background_color, pil_image=img)
+        # Try background rembg service first (fast if service is already running)
+        self._step2_status("Removing background…")
+        try:
+            from core.rembg_client import remove_background_via_service
+            rgba = remove_background_via_service(img)
+        except Exception:
+            rgba = None
+        # Fallback: in-process removal (three models + combine)
+        if rgba is None:
+            self._step2_status("Loading models (may download on first run)…")
+            mask_a, mask_b, mask_cloth = self._get_processor().get_masks_parallel(img)
+            self._step2_status("Combining masks and refining edges…")
+            rgba = self._get_processor().combine_masks_and_cutout(
+                img, mask_a, mask_b, mask_cloth=mask_cloth,
+                alpha_matting=True,
+                post_process_mask=True,
+            )
+        if future_bg is not None:
+            try:
+                # Run it here if no pool worker has picked it up (all busy with other Step 2 work)
+                bg = self._get_ai().suggest_background_color(pil_image=img) if future_bg.cancel() else future_bg.result()
+            except Exception:
+                bg = None
+        if rgba is not None:
+            with self._cutout_cache_lock:
+                self._cutout_cache[key] = (rgba, bg)
+                while len(self._cutout_cache) > CUTOUT_CACHE_SIZE:
+                    del self._cutout_cache[next(iter(self._cutout_cache))]
+        return rgba, bg
+
+    def _prefetch_step2(self):
+        """Start background removal for the new crop right away, so "Remove background" finds it (partly) done."""
+        self._cancel_step2_prefetch()
+        img = self.step1_cropped
+        if img is not None:
+            self._step2_prefetch = (img, self._bg_executor.submit(self._remove_background, img))
+
+    def _cancel_step2_prefetch(self):
+        """Drop the prefetched result (crop changed). A run already in progress finishes and is discarded."""
+        if self._step2_prefetch is not None:
+            self._step2_prefetch[1].cancel()
+            self._step2_prefetch = None
+
     def _run_step2(self):
         if self.step1_cropped is None or self._processing:
             return
@@ -466,96 +585,67 @@ class App(ctk.CTk):
         self.btn_remove_bg.configure(state="disabled")
         self._set_status("Connecting to background service…", "info")
         self._show_step2_loader()
-
-        def run():
-            t0 = time.perf_counter()
+        img = self.step1_cropped
+        prefetch = self._step2_prefetch
+        future = prefetch[1] if prefetch is not None and prefetch[0] is img else None
+        run = self._bg_executor.submit(self._run_step2_worker, img, future)
+        run.add_done_callback(lambda f: self.after(0, self._run_step2_finished, f))
+
+    def _run_step2_worker(self, img, future):
+        """Step 2 on a pool worker: background removal (or its prefetch result), then the default color."""
+        t0 = time.perf_counter()
+        try:
+            # cancel() succeeds only if the prefetch hasn't started: then run it here rather than
+            # wait on a queued task from inside the same pool
+            if future is not None and not future.cancel():
+                self._step2_status("Removing background…")
+                rgba, bg = future.result()
+            else:
+                rgba, bg = self._remove_background(img)
+            self.step2_bg_source = "api" if (ENABLE_GEMINI and bg is not None) else "default"
+            if bg is None:
+                bg = "#FFFFFF"
+            self.step2_gemini_suggested_hex = bg if ENABLE_GEMINI else None
+            if rgba is None:
+                err_msg = _get_rembg_error_message()
+                raise RuntimeError(err_msg or "Background removal failed")
+            preview = rgba.copy()
+            preview.thumbnail(STEP2_PREVIEW_SIZE, Image.Resampling.BILINEAR)
+            self.cached_rgba_preview = preview
+            self.cached_rgba = rgba
+            self.step2_bg_color = bg
+            self.after(0, lambda: self._set_status("Applying background color…", "info"))
+            step2_rgb = self._get_processor().apply_background(rgba, bg)
+            self.step2_with_bg = step2_rgb
+            elapsed = time.perf_counter() - t0
+            self.after(0, lambda: self._hide_step2_loader())
+            self.after(0, lambda: self._update_step2_color_ui())
+            self.after(0, lambda: self._show_preview_pil(self.preview_zoom_2, self.step2_with_bg))
+            self.after(0, lambda: self.btn_step2_next.configure(state="normal"))
+            self.after(0, lambda: self._set_status(f"Done in {elapsed:.1f}s. Change background color if you like, then Next → Step 3.", "success"))
+        except Exception as e:
+            self.after(0, lambda: self._hide_step2_loader())
+            err_msg = str(e)
             try:
-                img = self.step1_cropped
-                rgba = None
-                bg = None
-                # Try background rembg service first (fast if service is already running)
-                self.after(0, lambda: self._set_status("Removing background…", "info"))
-                try:
-                    from core.rembg_client import remove_background_via_service
-                    if ENABLE_GEMINI:
-                        with ThreadPoolExecutor(max_workers=2) as ex:
-                            future_rgba = ex.submit(remove_background_via_service, img)
-                            future_bg = ex.submit(self._get_ai().suggest_background_color, pil_image=img)
-                            rgba = future_rgba.result()
-                            bg = future_bg.result()
-                    else:
-                        rgba = remove_background_via_service(img)
-                        bg = None
-                except Exception:
-                    rgba = None
-                    bg = None
-                # Fallback: in-process removal (three models + combine)
-                if rgba is None:
-                    self.after(0, lambda: self._set_status("Loading models (may download on first run)…", "info"))
-                    if ENABLE_GEMINI:
-                        with ThreadPoolExecutor(max_workers=4) as ex:
-                            future_mask_a = ex.submit(self._get_processor().get_mask_a, img)
-                            future_mask_b = ex.submit(self._get_processor().get_mask_b, img)
-                            future_mask_cloth = ex.submit(self._get_processor().get_mask_cloth, img)
-                            future_bg = ex.submit(self._get_ai().suggest_background_color, pil_image=img)
-                            mask_a = future_mask_a.result()
-                            mask_b = future_mask_b.result()
-                            mask_cloth = future_mask_cloth.result()
-                            bg = future_bg.result()
-                    else:
-                        with ThreadPoolExecutor(max_workers=3) as ex:
-                            future_mask_a = ex.submit(self._get_processor().get_mask_a, img)
-                            future_mask_b = ex.submit(self._get_processor().get_mask_b, img)
-                            future_mask_cloth = ex.submit(self._get_processor().get_mask_cloth, img)
-                            mask_a = future_mask_a.result()
-                            mask_b = future_mask_b.result()
-                            mask_cloth = future_mask_cloth.result()
-                        bg = None
-                    self.after(0, lambda: self._set_status("Combining masks and refining edges…", "info"))
-                    rgba = self._get_processor().combine_masks_and_cutout(
-                        img, mask_a, mask_b, mask_cloth=mask_cloth,
-                        alpha_matting=True,
-                        post_process_mask=True,
-                    )
-                self.step2_bg_source = "api" if (ENABLE_GEMINI and bg is not None) else "default"
-                if bg is None:
-                    bg = "#FFFFFF"
-                self.step2_gemini_suggested_hex = bg if ENABLE_GEMINI else None
-                if rgba is None:
-                    err_msg = _get_rembg_error_message()
-                    raise RuntimeError(err_msg or "Background removal failed")
-                self.cached_rgba = rgba
-                self.step2_bg_color = bg
-                self.after(0, lambda: self._set_status("Applying background color…", "info"))
-                step2_rgb = self._get_processor().apply_background(rgba, bg)
-                self.step2_with_bg = self._get_processor().upscale_for_quality(step2_rgb, UPSCALE_FACTOR)
-                elapsed = time.perf_counter() - t0
-                self.after(0, lambda: self._hide_step2_loader())
-                self.after(0, lambda: self._update_step2_color_ui())
-                self.after(0, lambda: self._show_preview_pil(self.preview_zoom_2, self.step2_with_bg))
-                self.after(0, lambda: self.btn_step2_next.configure(state="normal"))
-                self.after(0, lambda: self._set_status(f"Done in {elapsed:.1f}s. Change background color if you like, then Next → Step 3.", "success"))
-            except Exception as e:
-                self.after(0, lambda: self._hide_step2_loader())
-                err_msg = str(e)
-                try:
-                    service_err = _get_rembg_error_message()
-                    if service_err:
-                        err_msg = service_err
-                except Exception:
-                    pass
-                self.after(0, lambda msg=err_msg: self._set_status(f"Error: {msg}", "error"))
-                self.after(0, lambda: self.btn_remove_bg.configure(state="normal"))
-            finally:
-                self._processing = False
-
-        threading.Thread(target=run, daemon=True).start()
-
-    def _update_step2_color_ui(self):
+                service_err = _get_rembg_error_message()
+                if service_err:
+                    err_msg = service_err
+            except Exception:
+                pass
+            self.after(0, lambda msg=err_msg: self._set_status(f"Error: {msg}", "error"))
+            self.after(0, lambda: self.btn_remove_bg.configure(state="normal"))
+
+    def _run_step2_finished(self, future):
+        """Back on the Tk thread once the worker is done (its own errors are already reported)."""
+        self._processing = False
+        if future.exception() is not None:
+            logging.getLogger(__name__).error("Step 2 failed", exc_info=future.exception())
+
+    def _update_step2_color_ui(self, update_picker=True):
         hex_color = self.step2_bg_color or "#FFFFFF"
         self.step2_color_swatch.configure(fg_color=hex_color)
         self.step2_color_label.configure(text=hex_color)
-        if hasattr(self, "step2_hsv_picker") and self.step2_hsv_picker.winfo_exists():
+        if update_picker and hasattr(self, "step2_hsv_picker") and self.step2_hsv_picker.winfo_exists():
             self.step2_hsv_picker.set_hex(hex_color)
         if ENABLE_GEMINI and self.step2_gemini_suggested_hex:
             self.step2_gemini_swatch.configure(fg_color=self.step2_gemini_suggested_hex)
@@ -569,34 +659,63 @@ class App(ctk.CTk):
             self._apply_bg_color(self.step2_gemini_suggested_hex)
 
     def _on_picker_color_change(self, hex_color):
-        """Called when user changes color via the HSV picker."""
-        self._apply_bg_color(hex_color)
-
-    def _apply_bg_color(self, hex_color):
+        """Called on every HSV picker drag step; the latest color is previewed at most once per frame."""
+        self._pending_picker_color = hex_color
+        if self._pending_picker_job is None:
+            self._pending_picker_job = self.after(16, self._flush_picker_color)
+
+    def _flush_picker_color(self):
+        self._pending_picker_job = None
+        self._apply_bg_color(self._pending_picker_color, preview=True, from_picker=True)
+
+    def _on_picker_color_release(self, hex_color):
+        """Mouse released on the picker: drop any queued preview and apply the color at full quality."""
+        if self._pending_picker_job is not None:
+            self.after_cancel(self._pending_picker_job)
+            self._pending_picker_job = None
+        self._apply_bg_color(hex_color, from_picker=True)
+
+    def _apply_bg_color(self, hex_color, preview=False, from_picker=False):
+        """
+        Composite cached_rgba on hex_color. preview=True (picker drag) only composites the preview-sized copy;
+        from_picker leaves the picker alone (it already shows the color, set_hex would snap it to 8-bit).
+        """
         if self.cached_rgba is None:
             return
         if not hex_color.startswith("#"):
             hex_color = "#" + hex_color
         self.step2_bg_color = hex_color
         self.step2_bg_source = "custom"
+        self._update_step2_color_ui(update_picker=not from_picker)
+        if preview:
+            # Only what the preview shows: composite the fitted copy (far fewer pixels than the crop)
+            # show_preview draws it at the full image's display size: zoom, scroll and the % label stay put
+            small = self.cached_rgba_preview if self.cached_rgba_preview is not None else self.cached_rgba
+            self.preview_zoom_2.show_preview(self._get_processor().apply_background(small, hex_color))
+            return
         step2_rgb = self._get_processor().apply_background(self.cached_rgba, hex_color)
-        self.step2_with_bg = self._get_processor().upscale_for_quality(step2_rgb, UPSCALE_FACTOR)
-        self._update_step2_color_ui()
-        self._show_preview_pil(self.preview_zoom_2, self.step2_with_bg)
+        self.step2_with_bg = step2_rgb
+        self._show_preview_pil(self.preview_zoom_2, self.step2_with_bg, keep_view=True)
         self._set_status("Background color updated.", "success")
 
     def _get_image_for_step3(self):
-        """Image to use for Step 3: with bg removal if done, otherwise cropped image."""
-        if self.step2_with_bg is not None:
-            return self.step2_with_bg
-        return self.step1_cropped
+        """
+        Image to use for Step 3: with bg removal if done (upscaled for quality, once per Step 2 result),
+        otherwise cropped image.
+        """
+        img = self.step2_with_bg
+        if img is None:
+            return self.step1_cropped
+        if self._step3_upscaled is None or self._step3_upscaled[0] is not img:
+            self._step3_upscaled = (img, self._get_processor().upscale_for_quality(img, UPSCALE_FACTOR))
+        return self._step3_upscaled[1]
 
     def _go_step3(self):
         if self._get_image_for_step3() is None:
             return
-        self._show_step(3)
-        self._preview_step3()
-        self.btn_export.configure(state="normal")
+        self._show_step(3)  # also renders the Step 3 preview
+        if not self._exporting:
+            self.btn_export.configure(state="normal")
         is_passport_34 = self._crop_ratio_index == 2
         self.btn_a4_print.configure(state="normal" if is_passport_34 else "disabled")
 
@@ -609,15 +728,34 @@ class App(ctk.CTk):
         self._show_preview_pil(self.preview_zoom_3, img)
 
     def _export_png(self):
-        img = self._get_image_for_step3()
-        if img is None:
+        if self._exporting or (self.step2_with_bg is None and self.step1_cropped is None):
             return
         add_border = self.border_check_var.get()
-        img = self._get_processor().add_border(img, BORDER_PX if add_border else 0)
         path = ctk.filedialog.asksaveasfilename(defaultextension=".png", filetypes=[("PNG", "*.png"), ("All", "*.*")], initialdir=os.path.expanduser("~"))
-        if path:
-            ok = self._get_processor().export_png(img, path)
-            self._set_status("Saved: " + path if ok else "Save failed.", "success" if ok else "error")
+        if not path:
+            return
+        # Resolve the image here (cached since Step 3 was shown): the save must use what is on screen now,
+        # and the worker must not touch step2_with_bg / _step3_upscaled while the user goes back to Step 2
+        img = self._get_image_for_step3()
+        processor = self._get_processor()
+
+        def save():
+            return processor.export_png(processor.add_border(img, BORDER_PX if add_border else 0), path)
+
+        # Border + PNG encode of the upscaled image run on the Step 2 pool; the window stays responsive
+        self._exporting = True
+        self.btn_export.configure(state="disabled")
+        self._set_status("Saving…", "info")
+        self._bg_executor.submit(save).add_done_callback(lambda f: self.after(0, self._export_done, f, path))
+
+    def _export_done(self, future, path):
+        self._exporting = False
+        self.btn_export.configure(state="normal")
+        try:
+            ok = future.result()
+        except Exception:
+            ok = False
+        self._set_status("Saved: " + path if ok else "Save failed.", "success" if ok else "error")
 
     def _open_a4_preview(self):
         img = self._get_image_for_step3()
@@ -628,10 +766,17 @@ class App(ctk.CTk):
         from a4_print_preview import open_a4_preview
         open_a4_preview(self, img)
 
-    def _show_preview_pil(self, widget, pil_image):
-        """Show PIL image in preview. widget is ZoomPanImage (set_image) or legacy label."""
+    def _show_preview_pil(self, widget, pil_image, keep_view=False):
+        """
+        Show PIL image in preview. widget is ZoomPanImage (set_image) or legacy label.
+        keep_view: same image with new content (color change), keep the ZoomPanImage's zoom and scroll.
+        """
         if hasattr(widget, "set_image"):
-            widget.set_image(pil_image)
+            if self._preview_steps.get(widget, self._current_step) != self._current_step:
+                self._pending_previews[widget] = pil_image  # step hidden: render when it's shown
+                return
+            self._pending_previews.pop(widget, None)
+            widget.set_image(pil_image, keep_view=keep_view)
             return
         if pil_image is None:
             widget.configure(image=None, text="No image")
@@ -642,18 +787,23 @@ class App(ctk.CTk):
         w = int(pil.width * r)
         h = int(pil.height * r)
         if r < 1:
-            pil = pil.resize((w, h), Image.Resampling.LANCZOS)
+            # reducing_gap: box-reduce first for big downscales, then LANCZOS (what thumbnail() does)
+            pil = pil.resize((w, h), Image.Resampling.LANCZOS, reducing_gap=2.0)
         ctk_img = ctk.CTkImage(light_image=pil, size=(w, h))
-        self._ctk_images = [img for img in self._ctk_images if img is not None][-4:]
-        self._ctk_images.append(ctk_img)
+        # Hold only the shown image and the one before it (outlives Tk's repaint); free older copies now, not at GC
+        while len(self._ctk_images) >= 2:
+            _, owned = self._ctk_images.popleft()
+            if owned is not None:
+                owned.close()
+        self._ctk_images.append((ctk_img, pil if pil is not pil_image else None))
         widget.configure(image=ctk_img, text="")
 
 
 def _get_initial_file_from_args():
     """Return first valid image path from sys.argv (for 'Open with' / drag-drop)."""
-    for i in range(1, len(sys.argv)):
-        path = sys.argv[i]
-        if path and os.path.isfile(path) and Path(path).suffix.lower() in IMAGE_EXT:
+    for path in sys.argv[1:]:
+        # Extension check first: a string op, while isfile() is a stat per argument
+        if path and os.path.splitext(path)[1].lower() in IMAGE_EXT and os.path.isfile(path):
             return path
     return None
 
@@ -2,11 +2,61 @@
 Zoom and pan image widget: canvas with zoom in/out buttons, scrollbars when zoomed,
 mouse wheel zoom, and click-drag pan. For Step 2 and Step 3 preview areas.
 """
+import logging
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from PIL import Image, ImageTk
 
 import customtkinter as ctk
 
+logger = logging.getLogger(__name__)
+
+
+def _resize_for_display(pil, size, fast=False):
+    """
+    Resize pil to size for the canvas. Uses OpenCV (SIMD, multithreaded) when available: INTER_AREA
+    when shrinking (proper antialiasing), Lanczos when enlarging. Falls back to Pillow's LANCZOS
+    (with reducing_gap, so big shrinks are mostly box-averaged).
+    fast=True (frames during a wheel gesture) uses bilinear instead. Enlarging 2x or more always uses
+    nearest neighbour: at that zoom the user is inspecting pixels, which smoothing would blur away.
+    """
+    pixel_peek = size[0] >= 2 * pil.width and size[1] >= 2 * pil.height
+    if pil.mode in ("RGB", "RGBA", "L"):
+        try:
+            import cv2
+            import numpy as np
+            shrink = size[0] < pil.width or size[1] < pil.height
+            if pixel_peek:
+                interpolation = cv2.INTER_NEAREST
+            elif fast:
+                interpolation = cv2.INTER_LINEAR
+            else:
+                interpolation = cv2.INTER_AREA if shrink else cv2.INTER_LANCZOS4
+            out = cv2.resize(np.asarray(pil), size, interpolation=interpolation)
+            return Image.frombuffer(pil.mode, size, out, "raw", pil.mode, 0, 1)
+        except ImportError:
+            pass
+    if pixel_peek:
+        return pil.resize(size, Image.Resampling.NEAREST)
+    if fast:
+        return pil.resize(size, Image.Resampling.BILINEAR)
+    # reducing_gap: shrinks of 2x or more do a cheap integer reduce() first, then LANCZOS on the small image
+    return pil.resize(size, Image.Resampling.LANCZOS, reducing_gap=2.0)
+
+
+def _render_frame(pil, fit, base, size, fast):
+    """
+    Worker-thread half of a redraw: the display-size frame for pil, and the fitted copy it came from
+    (built from pil at fit when needed and not passed in as base). Returns (frame, base).
+    """
+    if fit is not None and size[0] <= fit[0] and size[1] <= fit[1]:
+        # At or below fit-to-view: resample from the fitted copy, not the (much larger) original
+        if base is None:
+            base = _resize_for_display(pil, fit)
+        pil = base
+    frame = pil if pil.size == size else _resize_for_display(pil, size, fast)
+    return frame, base
+
 
 class ZoomPanImage(ctk.CTkFrame):
     """
@@ -14,9 +64,13 @@ class ZoomPanImage(ctk.CTkFrame):
     Call set_image(pil_image) to set the image. Placeholder text when no image.
     """
 
-    MIN_ZOOM = 0.0
+    MIN_ZOOM = 0.05
     MAX_ZOOM = 4.0
     ZOOM_STEP = 1.25
+    MIN_DISPLAY_AREA = 64  # px; zooming out stops before the image gets smaller than this
+    RENDER_CACHE_SIZE = 2  # current + previous frame: zooming out and back in again costs nothing
+    # Resizes run here so the Tk thread stays free (cv2/Pillow release the GIL); one worker, latest frame wins
+    _pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="zoompan")
 
     def __init__(self, parent, width=500, height=400, placeholder_text="Image will appear here", **kwargs):
         super().__init__(parent, fg_color="transparent", **kwargs)
@@ -24,10 +78,20 @@ class ZoomPanImage(ctk.CTkFrame):
         self._height = height
         self._placeholder = placeholder_text
         self._pil_image = None
+        self._fit_size = None  # (w, h) of the image fitted to the view, when that is a downscale
+        self._base_pil = None  # the image at _fit_size, made on first use; source for zoomed-out frames
         self._photo = None
+        self._photo_cache = {}  # (disp_w, disp_h, fast) -> PhotoImage for the current image; last RENDER_CACHE_SIZE frames
         self._zoom = 1.0
         self._image_id = None
         self._drag_start = None
+        self._total_size = (width, height)  # scrollregion size set by the last _redraw
+        self._last_geom = None  # (disp_w, disp_h, cw, ch) last laid out; None after a canvas resize
+        self._redraw_pending = False  # an after_idle _redraw is queued
+        self._render_seq = 0  # bumped per redraw/set_image; frames from older requests are dropped
+        self._render_future = None  # resize in flight on _pool
+        self._interactive = False  # mid wheel gesture: render bilinear frames
+        self._quality_job = None  # after() that re-renders at full quality once the wheel goes quiet
         self._canvas_bg = ("#2b2b2b", "#1a1a2e")
 
         self.grid_columnconfigure(0, weight=1)
@@ -41,6 +105,7 @@ class ZoomPanImage(ctk.CTkFrame):
         ctk.CTkButton(toolbar, text="− Zoom out", command=self._zoom_out, width=100, height=28, corner_radius=6).grid(row=0, column=1, padx=(0, 4))
         self._zoom_label = ctk.CTkLabel(toolbar, text="100%", font=ctk.CTkFont(size=11), text_color="gray")
         self._zoom_label.grid(row=0, column=2, padx=8)
+        self._zoom_text = "100%"
         ctk.CTkButton(toolbar, text="+ Zoom in", command=self._zoom_in, width=100, height=28, corner_radius=6).grid(row=0, column=3, padx=(4, 0))
 
         # Canvas + scrollbars (use tk.Frame so scrollbars work)
@@ -66,8 +131,13 @@ class ZoomPanImage(ctk.CTkFrame):
         self._v_scroll.config(command=self._canvas.yview)
         self._h_scroll.config(command=self._canvas.xview)
 
-        self._canvas.create_text(width // 2, height // 2, text=placeholder_text, fill="gray", font=("", 13), tags="placeholder")
-        self._canvas.create_image(0, 0, anchor="nw", tags="image")
+        self._canvas.create_image(0, 0, anchor="nw", tags="image", state=tk.HIDDEN)
+        # Placeholder sits over the canvas in the same grid cell; toggled only when an image comes or goes
+        self._placeholder_lbl = ctk.CTkLabel(
+            canvas_container, text=placeholder_text, text_color="gray", font=ctk.CTkFont(size=13), fg_color=self._canvas_bg[0]
+        )
+        self._placeholder_lbl.grid(row=0, column=0)
+        self._placeholder_shown = True
 
         self._canvas.bind("<MouseWheel>", self._on_wheel)
         self._canvas.bind("<Button-4>", self._on_wheel_linux)
@@ -75,10 +145,15 @@ class ZoomPanImage(ctk.CTkFrame):
         self._canvas.bind("<Button-1>", self._on_press)
         self._canvas.bind("<B1-Motion>", self._on_drag)
         self._canvas.bind("<ButtonRelease-1>", self._on_release)
+        self._canvas.bind("<Configure>", self._on_canvas_configure)
+
+    def _on_canvas_configure(self, event):
+        self._last_geom = None
 
     def _on_wheel(self, event):
         if self._pil_image is None:
             return
+        self._start_interactive()
         delta = event.delta
         if delta > 0:
             self._zoom_in()
@@ -88,22 +163,36 @@ class ZoomPanImage(ctk.CTkFrame):
     def _on_wheel_linux(self, event):
         if self._pil_image is None:
             return
+        self._start_interactive()
         if event.num == 4:
             self._zoom_in()
         elif event.num == 5:
             self._zoom_out()
 
+    def _start_interactive(self):
+        """Cheap frames while the wheel is turning; one full-quality frame 80 ms after the last step."""
+        self._interactive = True
+        if self._quality_job is not None:
+            self.after_cancel(self._quality_job)
+        self._quality_job = self.after(80, self._finalize_quality)
+
+    def _finalize_quality(self):
+        self._quality_job = None
+        self._interactive = False
+        self._schedule_redraw()
+
     def _on_press(self, event):
-        self._drag_start = (event.x, event.y)
+        # Pointer position and the view's top-left (canvas coords) when the drag began
+        self._drag_start = (event.x, event.y, self._canvas.canvasx(0), self._canvas.canvasy(0))
 
     def _on_drag(self, event):
         if self._drag_start is None:
             return
-        dx = event.x - self._drag_start[0]
-        dy = event.y - self._drag_start[1]
-        self._canvas.xview_scroll(-dx, "units")
-        self._canvas.yview_scroll(-dy, "units")
-        self._drag_start = (event.x, event.y)
+        x0, y0, left0, top0 = self._drag_start
+        total_w, total_h = self._total_size
+        # One absolute moveto per axis (Tk clamps to the scrollregion) instead of relative scroll steps
+        self._canvas.xview_moveto((left0 - (event.x - x0)) / total_w)
+        self._canvas.yview_moveto((top0 - (event.y - y0)) / total_h)
 
     def _on_release(self, event):
         self._drag_start = None
@@ -112,22 +201,44 @@ class ZoomPanImage(ctk.CTkFrame):
         if self._pil_image is None:
             return
         self._zoom = min(self.MAX_ZOOM, self._zoom * self.ZOOM_STEP)
-        self._redraw()
+        self._schedule_redraw()
 
     def _zoom_out(self):
         if self._pil_image is None:
             return
-        self._zoom = max(self.MIN_ZOOM, self._zoom / self.ZOOM_STEP)
+        zoom = max(self.MIN_ZOOM, self._zoom / self.ZOOM_STEP)
+        w, h = self._pil_image.size
+        if zoom == self._zoom or w * h * zoom * zoom < self.MIN_DISPLAY_AREA:
+            return  # at the limit: keep the current frame rather than render an invisible one
+        self._zoom = zoom
+        self._schedule_redraw()
+
+    def _schedule_redraw(self):
+        """Render once per event-loop pass at the latest zoom (a fast wheel/trackpad sends many steps)."""
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.after_idle(self._do_redraw)
+
+    def _do_redraw(self):
+        self._redraw_pending = False
         self._redraw()
 
-    def _redraw(self):
+    def _redraw(self, source=None):
+        """
+        Render the image at the current zoom. source: a reduced copy of the image to draw instead
+        (show_preview); its frame is sized as the full image would be and is not cached.
+        """
         if self._pil_image is None:
-            self._canvas.itemconfig("placeholder", state=tk.NORMAL)
-            self._canvas.itemconfig("image", state=tk.HIDDEN)
-            self._zoom_label.configure(text="—")
+            if not self._placeholder_shown:
+                self._placeholder_lbl.grid()
+                self._canvas.itemconfig("image", state=tk.HIDDEN)
+                self._placeholder_shown = True
+            self._set_zoom_label("—")
             return
-        self._canvas.itemconfig("placeholder", state=tk.HIDDEN)
-        self._canvas.itemconfig("image", state=tk.NORMAL)
+        if self._placeholder_shown:
+            self._placeholder_lbl.grid_remove()
+            self._canvas.itemconfig("image", state=tk.NORMAL)
+            self._placeholder_shown = False
         pil = self._pil_image
         w, h = pil.size
         cw = self._canvas.winfo_width()
@@ -138,7 +249,7 @@ class ZoomPanImage(ctk.CTkFrame):
             ch = self._height
         # Limit display size to avoid huge PhotoImage (e.g. max 3000 px)
         max_side = 3000
-        scale = max(self._zoom, 0.01)  # avoid 0-size display
+        scale = self._zoom
         disp_w = int(w * scale)
         disp_h = int(h * scale)
         if disp_w > max_side or disp_h > max_side:
@@ -147,18 +258,99 @@ class ZoomPanImage(ctk.CTkFrame):
             disp_h = int(disp_h * r)
         if disp_w < 1 or disp_h < 1:
             disp_w, disp_h = max(1, disp_w), max(1, disp_h)
-        disp_pil = pil.resize((disp_w, disp_h), Image.Resampling.LANCZOS)
-        self._photo = ImageTk.PhotoImage(disp_pil)
-        self._canvas.itemconfig("image", image=self._photo)
+        fast = self._interactive
+        key = (disp_w, disp_h, fast)
+        self._render_seq += 1
+        if self._render_future is not None:
+            self._render_future.cancel()  # superseded; no-op if already running (result is dropped)
+            self._render_future = None
+        if source is not None:
+            fast = True
+            key = None
+            pil = source
+        photo = self._photo_cache.get(key) if key is not None else None
+        if photo is not None:
+            self._show_frame(photo, disp_w, disp_h, cw, ch)
+            return
+        if pil.size == (disp_w, disp_h):
+            self._apply_rendered(self._render_seq, (disp_w, disp_h), key, (pil, None), cw, ch)
+            return
+        seq = self._render_seq
+        size = (disp_w, disp_h)
+        if source is not None:
+            future = self._pool.submit(_render_frame, pil, None, None, size, fast)
+        else:
+            future = self._pool.submit(_render_frame, pil, self._fit_size, self._base_pil, size, fast)
+        self._render_future = future
+        future.add_done_callback(lambda f: self._post_rendered(f, seq, pil, size, key, cw, ch))
+
+    def _post_rendered(self, future, seq, pil, size, key, cw, ch):
+        """Worker-thread done callback: hand the frame to the Tk thread (PhotoImage must be made there)."""
+        if future.cancelled():
+            return
+        try:
+            self.after(0, self._on_rendered, future, seq, pil, size, key, cw, ch)
+        except (RuntimeError, tk.TclError):
+            pass  # widget destroyed / main loop gone
+
+    def _on_rendered(self, future, seq, pil, size, key, cw, ch):
+        if seq != self._render_seq:
+            return  # superseded; don't look at the result
+        exc = future.exception()
+        if exc is None:
+            self._apply_rendered(seq, size, key, future.result(), cw, ch)
+            return
+        logger.error("Zoom frame render failed; retrying with a plain Pillow resize", exc_info=exc)
+        self._render_future = None
+        try:
+            frame = pil.resize(size, Image.Resampling.BILINEAR)
+        except Exception:
+            logger.exception("Zoom frame fallback resize failed; keeping the previous frame")
+            return
+        self._apply_rendered(seq, size, None, (frame, None), cw, ch)  # not cached: next redraw retries full quality
+
+    def _apply_rendered(self, seq, size, key, result, cw, ch):
+        if seq != self._render_seq:
+            return  # a newer redraw or image superseded this frame
+        self._render_future = None
+        frame, base = result
+        if base is not None and self._base_pil is None:
+            self._base_pil = base
+        disp_w, disp_h = size
+        shown = self._photo
+        if shown is not None and (shown.width(), shown.height()) == (disp_w, disp_h):
+            # Same size as the frame on screen (e.g. new background color): overwrite it in place
+            shown.paste(frame)
+            photo = shown
+            for k in [k for k, v in self._photo_cache.items() if v is shown]:
+                del self._photo_cache[k]  # its old content is gone
+        else:
+            photo = ImageTk.PhotoImage(frame)
+        if key is not None:
+            self._photo_cache[key] = photo
+            while len(self._photo_cache) > self.RENDER_CACHE_SIZE:
+                del self._photo_cache[next(iter(self._photo_cache))]
+        self._show_frame(photo, disp_w, disp_h, cw, ch)
+
+    def _show_frame(self, photo, disp_w, disp_h, cw, ch):
+        """Put photo on the canvas and lay out scrollregion, position, zoom label and scrollbars for it."""
+        if photo is not self._photo:
+            self._photo = photo
+            self._canvas.itemconfig("image", image=photo)
+        self._set_zoom_label(f"{int(self._zoom * 100)}%")
         # Virtual size: at least canvas size so we can center when image is smaller
         total_w = max(disp_w, cw)
         total_h = max(disp_h, ch)
+        geom = (disp_w, disp_h, cw, ch)
+        if geom == self._last_geom:
+            return  # same layout as the last frame: skip the scrollregion/scrollbar Tk calls
+        self._last_geom = geom
         # Center image when smaller than view (vertical center if disp_h < ch, horizontal if disp_w < cw)
         img_x = (total_w - disp_w) // 2
         img_y = (total_h - disp_h) // 2
         self._canvas.coords("image", img_x, img_y)
         self._canvas.configure(scrollregion=(0, 0, total_w, total_h))
-        self._zoom_label.configure(text=f"{int(self._zoom * 100)}%")
+        self._total_size = (total_w, total_h)
         # Show/hide scrollbars based on whether content is larger than canvas
         if total_w > cw or total_h > ch:
             self._h_scroll.grid()
@@ -167,10 +359,31 @@ class ZoomPanImage(ctk.CTkFrame):
             self._h_scroll.grid_remove()
             self._v_scroll.grid_remove()
 
-    def set_image(self, pil_image):
-        """Set the image to display. None clears and shows placeholder."""
+    def _set_zoom_label(self, text):
+        """Configure the zoom label only when its text changes (a configure re-lays out the toolbar)."""
+        if text != self._zoom_text:
+            self._zoom_text = text
+            self._zoom_label.configure(text=text)
+
+    def set_image(self, pil_image, keep_view=False):
+        """
+        Set the image to display. None clears and shows placeholder.
+        Modes other than RGB/RGBA/L (P, LA, I, ...) are converted once here so redraws never reconvert.
+        keep_view: when the new image is the same size as the current one (e.g. only the background color
+        changed), keep the zoom and scroll position instead of resetting to fit-to-view.
+        """
+        if pil_image is not None and pil_image.mode not in ("RGB", "RGBA", "L"):
+            has_alpha = "A" in pil_image.getbands() or "transparency" in pil_image.info
+            pil_image = pil_image.convert("RGBA" if has_alpha else "RGB")
+        same_view = keep_view and pil_image is not None and self._pil_image is not None and pil_image.size == self._pil_image.size
         self._pil_image = pil_image
-        if pil_image is None:
+        self._render_seq += 1  # drop frames still being rendered from the previous image
+        self._base_pil = None
+        self._photo_cache.clear()
+        if same_view:
+            pass  # zoom and _fit_size depend only on the image size, which is unchanged
+        elif pil_image is None:
+            self._fit_size = None
             self._zoom = 1.0
         else:
             # Initial zoom: fit-to-view when image is larger than canvas, else 100%.
@@ -179,8 +392,24 @@ class ZoomPanImage(ctk.CTkFrame):
             cw, ch = self._width, self._height
             fit = min(cw / w, ch / h)
             self._zoom = max(self.MIN_ZOOM, min(fit, 1.0))
-        self._redraw()
+            self._fit_size = None
+            if fit < 1:
+                self._fit_size = (max(1, int(w * fit)), max(1, int(h * fit)))
+        self._schedule_redraw()
+
+    def show_preview(self, pil_image):
+        """
+        Temporarily draw pil_image, a reduced copy of the current image (e.g. a live recolor of the fitted copy),
+        at the current zoom and position. Zoom, label and the image itself are unchanged; the next set_image
+        or zoom replaces the frame. With no image set yet this is just set_image.
+        """
+        if self._pil_image is None:
+            self.set_image(pil_image)
+            return
+        if pil_image.mode not in ("RGB", "RGBA", "L"):
+            pil_image = pil_image.convert("RGBA" if "A" in pil_image.getbands() else "RGB")
+        self._redraw(source=pil_image)
 
     def get_image(self):
-        """Return the current PIL image (or None)."""
+        """Return the current PIL image (or None); the mode-normalized copy if set_image converted it."""
         return self._pil_image